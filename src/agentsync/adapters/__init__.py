@@ -1,9 +1,15 @@
 """Source and target adapters for different AI coding agents."""
 
-from agentsync.adapters.antigravity import AntigravityTargetAdapter
-from agentsync.adapters.claude import ClaudeSourceAdapter
-from agentsync.adapters.codex import CodexTargetAdapter
-from agentsync.adapters.cursor import CursorTargetAdapter
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from agentsync.adapters.antigravity import AntigravityTargetAdapter
+    from agentsync.adapters.claude import ClaudeSourceAdapter
+    from agentsync.adapters.codex import CodexTargetAdapter
+    from agentsync.adapters.cursor import CursorTargetAdapter
 
 __all__ = [
     "AntigravityTargetAdapter",
@@ -11,3 +17,19 @@ __all__ = [
     "CodexTargetAdapter",
     "CursorTargetAdapter",
 ]
+
+# Adapter modules are imported on first attribute access, so importing one
+# adapter submodule doesn't pull in all the others.
+_EXPORTS = {
+    "AntigravityTargetAdapter": "agentsync.adapters.antigravity",
+    "ClaudeSourceAdapter": "agentsync.adapters.claude",
+    "CodexTargetAdapter": "agentsync.adapters.codex",
+    "CursorTargetAdapter": "agentsync.adapters.cursor",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
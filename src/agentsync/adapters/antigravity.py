@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import json
+import functools
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +15,7 @@ from agentsync.adapters.base import (
     WriteResult,
 )
 from agentsync.config import AgentSyncConfig, TargetConfig, resolve_path
+from agentsync.utils import json_fast
 from agentsync.utils.io import write_json
 from agentsync.utils.logger import SilentLogger, SyncLogger
 from agentsync.validate import check_server_consistency
@@ -49,30 +51,32 @@ class AntigravityTargetAdapter(TargetAdapter):
         results: list[WriteResult] = []
         backup_dir = self._backup_dir()
 
-        if self._mcp_data is not None and self._tc.mcp_path:
-            path = resolve_path(self._tc.mcp_path, self._config.config_dir)
+        if self._mcp_data is not None and self._mcp_path is not None:
+            path = self._mcp_path
             results.append(write_json(path, self._mcp_data, self._log, backup_dir, dry_run))
 
         # Rules are not supported — skip entirely
         return results
 
-    def validate(self) -> list[ValidationResult]:
+    def validate(
+        self, expected_servers: Mapping[str, ServerConfig] | None = None
+    ) -> list[ValidationResult]:
         results: list[ValidationResult] = []
 
-        mcp_path = (
-            resolve_path(self._tc.mcp_path, self._config.config_dir) if self._tc.mcp_path else None
-        )
+        mcp_path = self._mcp_path
         if mcp_path and mcp_path.is_file():
             try:
-                data = json.loads(mcp_path.read_text(encoding="utf-8"))
-                actual = set(data.get("mcpServers", {}))
-            except (json.JSONDecodeError, OSError):
+                actual = json_fast.member_keys(mcp_path.read_bytes(), "mcpServers")
+            except (json_fast.DecodeError, OSError):
                 actual = set()
 
-            expected = self._load_expected_servers()
-            exclude = set(self._tc.exclude_servers)
+            expected = (
+                expected_servers if expected_servers is not None else self._load_expected_servers()
+            )
             results.append(
-                check_server_consistency(expected, actual, "antigravity", exclude, stdio_only=True)
+                check_server_consistency(
+                    expected, actual, "antigravity", self._tc.exclude_set, stdio_only=True
+                )
             )
         else:
             results.append(
@@ -90,13 +94,22 @@ class AntigravityTargetAdapter(TargetAdapter):
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @functools.cached_property
+    def _mcp_path(self) -> Path | None:
+        if not self._tc.mcp_path:
+            return None
+        return resolve_path(self._tc.mcp_path, self._config.config_dir)
+
     def _backup_dir(self) -> Path | None:
         if not self._config.sync.backup:
             return None
+        return self._backup_dir_path
+
+    @functools.cached_property
+    def _backup_dir_path(self) -> Path:
         return resolve_path(self._config.sync.backup_dir, self._config.config_dir)
 
-    def _load_expected_servers(self) -> dict[str, ServerConfig]:
-        from agentsync.adapters.claude import ClaudeSourceAdapter
+    def _load_expected_servers(self) -> Mapping[str, ServerConfig]:
+        from agentsync.adapters.claude import load_servers_cached
 
-        source = ClaudeSourceAdapter(self._config)
-        return source.load_servers()
+        return load_servers_cached(self._config)
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
+from agentsync.utils.compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class ServerConfig:
     """Represents an MCP server configuration."""
 
@@ -23,7 +26,7 @@ class ServerConfig:
         return "url" in self.config
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Section:
     """Represents a markdown section (## or ###)."""
 
@@ -32,7 +35,7 @@ class Section:
     content: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class WriteResult:
     """Result of a write operation."""
 
@@ -42,7 +45,7 @@ class WriteResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ValidationResult:
     """Result of a single validation check."""
 
@@ -80,5 +83,11 @@ class TargetAdapter(ABC):
         """Write generated configs to target paths."""
 
     @abstractmethod
-    def validate(self) -> list[ValidationResult]:
-        """Validate existing target configs."""
+    def validate(
+        self, expected_servers: Mapping[str, ServerConfig] | None = None
+    ) -> list[ValidationResult]:
+        """Validate existing target configs.
+
+        *expected_servers* are the source servers to check against; when
+        ``None`` the adapter loads them itself.
+        """
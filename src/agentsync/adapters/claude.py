@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-import json
+import functools
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from agentsync.adapters.base import Section, ServerConfig, SourceAdapter
-from agentsync.config import AgentSyncConfig, resolve_path
+from agentsync.config import AgentSyncConfig, SourceConfig, resolve_path
+from agentsync.utils import json_fast
 from agentsync.utils.logger import SilentLogger, SyncLogger
 from agentsync.utils.markdown import parse_markdown_sections
 
@@ -30,6 +33,8 @@ class ClaudeSourceAdapter(SourceAdapter):
     ) -> None:
         self._config = config
         self._log = logger or SilentLogger()
+        # Parsed CLAUDE.md, reused while its mtime and size are unchanged.
+        self._rules_cache: tuple[tuple[Path, tuple[int, int] | None], list[Section]] | None = None
 
     # ------------------------------------------------------------------
     # SourceAdapter interface
@@ -37,7 +42,9 @@ class ClaudeSourceAdapter(SourceAdapter):
 
     def load_servers(self) -> dict[str, ServerConfig]:
         """Load and merge MCP servers from all three tiers."""
-        merged: dict[str, ServerConfig] = {}
+        top_level: dict[str, Any] = {}
+        project_servers: dict[str, Any] = {}
+        local_servers: dict[str, Any] = {}
 
         # Tier 1 & 2: ~/.claude.json (global + project-specific)
         global_path = resolve_path(self._config.source.global_config, self._config.config_dir)
@@ -45,9 +52,9 @@ class ClaudeSourceAdapter(SourceAdapter):
 
         if global_data is not None:
             # Tier 1: top-level mcpServers
-            top_level = global_data.get("mcpServers", {})
-            if isinstance(top_level, dict):
-                merged.update(self._extract_servers(top_level))
+            raw = global_data.get("mcpServers", {})
+            if isinstance(raw, dict):
+                top_level = raw
                 self._log.info(f"Global config: {len(top_level)} servers from {global_path}")
 
             # Tier 2: projects[config_dir].mcpServers
@@ -56,10 +63,9 @@ class ClaudeSourceAdapter(SourceAdapter):
                 project_key = str(self._config.config_dir)
                 project_block = projects.get(project_key, {})
                 if isinstance(project_block, dict):
-                    project_servers = project_block.get("mcpServers", {})
-                    if isinstance(project_servers, dict) and project_servers:
-                        extracted = self._extract_servers(project_servers)
-                        merged.update(extracted)
+                    raw = project_block.get("mcpServers", {})
+                    if isinstance(raw, dict) and raw:
+                        project_servers = raw
                         self._log.info(
                             f"Project config: {len(project_servers)} servers for {project_key}"
                         )
@@ -69,12 +75,18 @@ class ClaudeSourceAdapter(SourceAdapter):
         mcp_data = self._read_json(mcp_path)
 
         if mcp_data is not None:
-            local_servers = mcp_data.get("mcpServers", {})
-            if isinstance(local_servers, dict):
-                merged.update(self._extract_servers(local_servers))
+            raw = mcp_data.get("mcpServers", {})
+            if isinstance(raw, dict):
+                local_servers = raw
                 self._log.info(f"Local .mcp.json: {len(local_servers)} servers from {mcp_path}")
 
-        return merged
+        # Later tiers overwrite earlier ones, exactly as successive update() calls would
+        return {
+            name: ServerConfig(name=name, config=cfg)
+            for tier in (top_level, project_servers, local_servers)
+            for name, cfg in tier.items()
+            if isinstance(cfg, dict)
+        }
 
     def load_rules(self) -> list[Section]:
         """Load and parse rules from CLAUDE.md."""
@@ -84,19 +96,26 @@ class ClaudeSourceAdapter(SourceAdapter):
             self._log.warn(f"Rules file not found: {rules_path}")
             return []
 
-        try:
-            content = rules_path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError) as exc:
-            self._log.warn(f"Cannot read {rules_path}: {exc}")
-            return []
+        key = (rules_path, _file_signature(rules_path))
+        if self._rules_cache is not None and self._rules_cache[0] == key:
+            sections = self._rules_cache[1]
+        else:
+            try:
+                content = rules_path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError) as exc:
+                self._log.warn(f"Cannot read {rules_path}: {exc}")
+                return []
 
-        if not content.strip():
-            self._log.warn(f"Rules file is empty: {rules_path}")
-            return []
+            if not content.strip():
+                self._log.warn(f"Rules file is empty: {rules_path}")
+                return []
+
+            sections = parse_markdown_sections(content)
+            self._rules_cache = (key, sections)
 
-        sections = parse_markdown_sections(content)
         self._log.info(f"Loaded {len(sections)} sections from {rules_path}")
-        return sections
+        # Copies, so callers editing a section cannot alter the cached ones.
+        return [Section(s.header, s.level, s.content) for s in sections]
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -104,13 +123,21 @@ class ClaudeSourceAdapter(SourceAdapter):
 
     def _read_json(self, path: Path) -> dict[str, Any] | None:
         """Safely read a JSON file. Returns None on missing file or invalid JSON."""
-        if not path.is_file():
+        # Open directly instead of stat-ing first; unbuffered since the whole
+        # file is read in one call and handed to the parser as bytes.
+        try:
+            with open(path, "rb", buffering=0) as f:
+                data = f.readall()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
             self._log.warn(f"File not found: {path}")
             return None
+        except OSError as exc:
+            self._log.warn(f"Cannot read {path}: {exc}")
+            return None
 
         try:
-            raw = json.loads(path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError, UnicodeDecodeError) as exc:
+            raw = json_fast.loads(data)
+        except json_fast.DecodeError as exc:
             self._log.warn(f"Cannot read {path}: {exc}")
             return None
 
@@ -120,10 +147,52 @@ class ClaudeSourceAdapter(SourceAdapter):
 
         return raw
 
-    def _extract_servers(self, raw: dict[str, Any]) -> dict[str, ServerConfig]:
-        """Convert a raw ``mcpServers`` dict into ``{name: ServerConfig}``."""
-        result: dict[str, ServerConfig] = {}
-        for name, cfg in raw.items():
-            if isinstance(cfg, dict):
-                result[name] = ServerConfig(name=name, config=cfg)
-        return result
+
+# ===================================================================
+# Memoized server loading (shared by target adapters' validate())
+# ===================================================================
+
+
+def load_servers_cached(config: AgentSyncConfig) -> Mapping[str, ServerConfig]:
+    """Return ``ClaudeSourceAdapter(config).load_servers()``, memoized.
+
+    Results are keyed on the source paths and their mtime/size, so several
+    targets validating against the same source parse it only once, while an
+    edited source file is picked up on the next call.  The result is a
+    read-only view of the cached dict.
+    """
+    src = config.source
+    global_path = resolve_path(src.global_config, config.config_dir)
+    mcp_path = resolve_path(src.project_mcp, config.config_dir)
+    servers = _load_servers_for(
+        str(config.config_dir),
+        src.global_config,
+        src.project_mcp,
+        _file_signature(global_path),
+        _file_signature(mcp_path),
+    )
+    return MappingProxyType(servers)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_servers_for(
+    config_dir: str,
+    global_config: str,
+    project_mcp: str,
+    global_sig: tuple[int, int] | None,
+    mcp_sig: tuple[int, int] | None,
+) -> dict[str, ServerConfig]:
+    # The signatures are only part of the cache key.
+    config = AgentSyncConfig(
+        source=SourceConfig(global_config=global_config, project_mcp=project_mcp),
+        config_dir=Path(config_dir),
+    )
+    return ClaudeSourceAdapter(config).load_servers()
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
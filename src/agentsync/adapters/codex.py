@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import re
+import functools
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from agentsync.adapters.base import (
     Section,
@@ -14,7 +15,7 @@ from agentsync.adapters.base import (
     WriteResult,
 )
 from agentsync.config import AgentSyncConfig, TargetConfig, resolve_path
-from agentsync.utils.io import write_text
+from agentsync.utils.io import read_existing, write_text
 from agentsync.utils.logger import SilentLogger, SyncLogger
 from agentsync.validate import check_server_consistency
 
@@ -42,11 +43,15 @@ class CodexTargetAdapter(TargetAdapter):
     # ------------------------------------------------------------------
 
     def generate_mcp(self, servers: dict[str, ServerConfig]) -> str:
-        lines: list[str] = []
+        # One flat fragment list, joined once; tables are blank-line separated.
+        parts: list[str] = [MARKER_START, "\n"]
         for name, sc in servers.items():
-            lines.append(_server_to_toml(name, sc.config))
-        inner = "\n".join(lines)
-        self._mcp_text = f"{MARKER_START}\n{inner}\n{MARKER_END}\n"
+            _append_server_toml(parts, name, sc.config)
+            parts.append("\n")
+        if not servers:
+            parts.append("\n")
+        parts.append(MARKER_END + "\n")
+        self._mcp_text = "".join(parts)
         return self._mcp_text
 
     def generate_rules(self, sections: list[Section]) -> str:
@@ -58,32 +63,39 @@ class CodexTargetAdapter(TargetAdapter):
         results: list[WriteResult] = []
         backup_dir = self._backup_dir()
 
-        if self._mcp_text is not None and self._tc.config_path:
-            path = resolve_path(self._tc.config_path, self._config.config_dir)
-            content = self._merge_toml(path, self._mcp_text)
-            results.append(write_text(path, content, self._log, backup_dir, dry_run))
+        if self._mcp_text is not None and self._config_path is not None:
+            path = self._config_path
+            # Read once: the same bytes feed the merge and the change check.
+            existing = read_existing(path)
+            content = self._merge_toml(existing, self._mcp_text)
+            results.append(
+                write_text(path, content, self._log, backup_dir, dry_run, existing=existing)
+            )
 
-        if self._rules_text is not None and self._tc.rules_path:
-            path = resolve_path(self._tc.rules_path, self._config.config_dir)
+        if self._rules_text is not None and self._rules_path is not None:
+            path = self._rules_path
             results.append(write_text(path, self._rules_text, self._log, backup_dir, dry_run))
 
         return results
 
-    def validate(self) -> list[ValidationResult]:
+    def validate(
+        self, expected_servers: Mapping[str, ServerConfig] | None = None
+    ) -> list[ValidationResult]:
         results: list[ValidationResult] = []
 
-        config_path = (
-            resolve_path(self._tc.config_path, self._config.config_dir)
-            if self._tc.config_path
-            else None
-        )
+        config_path = self._config_path
         if config_path and config_path.is_file():
             content = config_path.read_text(encoding="utf-8")
             if MARKER_START in content and MARKER_END in content:
                 actual = _extract_server_names(content)
-                expected = self._load_expected_servers()
-                exclude = set(self._tc.exclude_servers)
-                results.append(check_server_consistency(expected, actual, "codex", exclude))
+                expected = (
+                    expected_servers
+                    if expected_servers is not None
+                    else self._load_expected_servers()
+                )
+                results.append(
+                    check_server_consistency(expected, actual, "codex", self._tc.exclude_set)
+                )
             else:
                 results.append(
                     ValidationResult(
@@ -109,31 +121,51 @@ class CodexTargetAdapter(TargetAdapter):
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _merge_toml(self, path: Path, managed_block: str) -> str:
+    def _merge_toml(self, existing_bytes: bytes | None, managed_block: str) -> str:
         """Merge managed block into existing TOML, or create a new file."""
-        if not path.is_file():
+        if existing_bytes is None:
             return managed_block
 
-        existing = path.read_text(encoding="utf-8")
-        if MARKER_START in existing and MARKER_END in existing:
-            # Replace content between markers (inclusive)
-            pattern = re.escape(MARKER_START) + r".*?" + re.escape(MARKER_END) + r"\n?"
-            return re.sub(pattern, managed_block, existing, flags=re.DOTALL)
+        # Same newline handling as text-mode reads: \r\n and \r become \n.
+        existing = existing_bytes.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        start = existing.find(MARKER_START)
+        end = existing.find(MARKER_END, start) if start >= 0 else -1
+        if end >= 0:
+            # Replace content between markers (inclusive) plus one trailing newline
+            tail = end + len(MARKER_END)
+            if existing.startswith("\n", tail):
+                tail += 1
+            return existing[:start] + managed_block + existing[tail:]
 
         # No markers — append
         sep = "" if existing.endswith("\n") else "\n"
         return existing + sep + "\n" + managed_block
 
+    @functools.cached_property
+    def _config_path(self) -> Path | None:
+        if not self._tc.config_path:
+            return None
+        return resolve_path(self._tc.config_path, self._config.config_dir)
+
+    @functools.cached_property
+    def _rules_path(self) -> Path | None:
+        if not self._tc.rules_path:
+            return None
+        return resolve_path(self._tc.rules_path, self._config.config_dir)
+
     def _backup_dir(self) -> Path | None:
         if not self._config.sync.backup:
             return None
+        return self._backup_dir_path
+
+    @functools.cached_property
+    def _backup_dir_path(self) -> Path:
         return resolve_path(self._config.sync.backup_dir, self._config.config_dir)
 
-    def _load_expected_servers(self) -> dict[str, ServerConfig]:
-        from agentsync.adapters.claude import ClaudeSourceAdapter
+    def _load_expected_servers(self) -> Mapping[str, ServerConfig]:
+        from agentsync.adapters.claude import load_servers_cached
 
-        source = ClaudeSourceAdapter(self._config)
-        return source.load_servers()
+        return load_servers_cached(self._config)
 
 
 # ===================================================================
@@ -143,36 +175,80 @@ class CodexTargetAdapter(TargetAdapter):
 
 def _toml_value(val: Any) -> str:
     """Serialize a single Python value to TOML literal."""
-    if isinstance(val, bool):
-        return "true" if val else "false"
-    if isinstance(val, int):
-        return str(val)
-    if isinstance(val, float):
-        return str(val)
-    if isinstance(val, str):
-        # Escape backslashes and double quotes
-        escaped = val.replace("\\", "\\\\").replace('"', '\\"')
-        return f'"{escaped}"'
-    if isinstance(val, list):
-        items = ", ".join(_toml_value(v) for v in val)
-        return f"[{items}]"
-    if isinstance(val, dict):
-        # Inline table
-        pairs = ", ".join(f"{k} = {_toml_value(v)}" for k, v in val.items())
-        return "{" + pairs + "}"
+    handler = _TOML_HANDLERS.get(type(val))
+    if handler is not None:
+        return handler(val)
+    # Subclasses (e.g. OrderedDict, IntEnum) miss the exact-type lookup
+    for base, handler in _TOML_HANDLERS.items():
+        if isinstance(val, base):
+            return handler(val)
     return repr(val)
 
 
+def _toml_bool(val: bool) -> str:
+    return "true" if val else "false"
+
+
+def _toml_str(val: str) -> str:
+    # Escape backslashes and double quotes
+    escaped = val.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _toml_list(val: list[Any]) -> str:
+    items = ", ".join([_toml_value(v) for v in val])
+    return f"[{items}]"
+
+
+def _toml_inline_table(val: dict[Any, Any]) -> str:
+    pairs = ", ".join([f"{k} = {_toml_value(v)}" for k, v in val.items()])
+    return "{" + pairs + "}"
+
+
+# Exact-type dispatch for _toml_value.  Order matters for the isinstance
+# fallback: bool must precede int because bool subclasses int.
+_TOML_HANDLERS: dict[type, Callable[[Any], str]] = {
+    bool: _toml_bool,
+    int: str,
+    float: str,
+    str: _toml_str,
+    list: _toml_list,
+    dict: _toml_inline_table,
+}
+
+
 def _server_to_toml(name: str, config: dict[str, Any]) -> str:
     """Render a single server config as a TOML table."""
+    parts: list[str] = []
+    _append_server_toml(parts, name, config)
+    return "".join(parts)
+
+
+def _append_server_toml(parts: list[str], name: str, config: dict[str, Any]) -> None:
+    """Append the TOML table for one server to *parts*, one fragment per line."""
     # Codex uses underscores in table names
     safe_name = name.replace("-", "_")
-    lines = [f"[mcp_servers.{safe_name}]"]
+    parts.append(f"[mcp_servers.{safe_name}]\n")
     for key, val in config.items():
-        lines.append(f"{key} = {_toml_value(val)}")
-    return "\n".join(lines) + "\n"
+        parts.append(f"{key} = {_toml_value(val)}\n")
+
+
+_TABLE_PREFIX = "[mcp_servers."
 
 
 def _extract_server_names(content: str) -> set[str]:
     """Extract server names from TOML [mcp_servers.xxx] headers."""
-    return set(re.findall(r"\[mcp_servers\.(.+?)\]", content))
+    # Plain substring search: the prefix is a literal, so no regex needed.
+    names: set[str] = set()
+    find = content.find
+    i = find(_TABLE_PREFIX)
+    while i >= 0:
+        start = i + len(_TABLE_PREFIX)
+        end = find("]", start)
+        if end < 0:
+            break
+        name = content[start:end]
+        if name and "\n" not in name:
+            names.add(name)
+        i = find(_TABLE_PREFIX, start)
+    return names
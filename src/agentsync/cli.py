@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import functools
+import importlib
 import sys
-from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import click
 
@@ -29,34 +30,40 @@ class AdapterError(Exception):
     """Raised when no adapter is registered for a given type."""
 
 
-def create_source(config: AgentSyncConfig) -> SourceAdapter:
-    """Instantiate a source adapter from *config.source.type*."""
-    if config.source.type == "claude":
-        from agentsync.adapters.claude import ClaudeSourceAdapter
+# type -> (module, class).  Modules are imported only when an adapter of
+# that type is actually configured.
+_SOURCE_ADAPTERS: dict[str, tuple[str, str]] = {
+    "claude": ("agentsync.adapters.claude", "ClaudeSourceAdapter"),
+}
+_TARGET_ADAPTERS: dict[str, tuple[str, str]] = {
+    "cursor": ("agentsync.adapters.cursor", "CursorTargetAdapter"),
+    "codex": ("agentsync.adapters.codex", "CodexTargetAdapter"),
+    "antigravity": ("agentsync.adapters.antigravity", "AntigravityTargetAdapter"),
+}
+
 
-        return ClaudeSourceAdapter(config)
+@functools.cache
+def _adapter_class(module_name: str, class_name: str) -> Any:
+    return getattr(importlib.import_module(module_name), class_name)
 
-    raise AdapterError(f"No adapter registered for source type '{config.source.type}'.")
+
+def create_source(config: AgentSyncConfig) -> SourceAdapter:
+    """Instantiate a source adapter from *config.source.type*."""
+    spec = _SOURCE_ADAPTERS.get(config.source.type)
+    if spec is None:
+        raise AdapterError(f"No adapter registered for source type '{config.source.type}'.")
+    source: SourceAdapter = _adapter_class(*spec)(config)
+    return source
 
 
 def create_targets(config: AgentSyncConfig) -> dict[str, TargetAdapter]:
     """Instantiate target adapters from *config.targets*."""
     targets: dict[str, TargetAdapter] = {}
     for name, tc in config.targets.items():
-        if tc.type == "cursor":
-            from agentsync.adapters.cursor import CursorTargetAdapter
-
-            targets[name] = CursorTargetAdapter(tc, config)
-        elif tc.type == "codex":
-            from agentsync.adapters.codex import CodexTargetAdapter
-
-            targets[name] = CodexTargetAdapter(tc, config)
-        elif tc.type == "antigravity":
-            from agentsync.adapters.antigravity import AntigravityTargetAdapter
-
-            targets[name] = AntigravityTargetAdapter(tc, config)
-        else:
+        spec = _TARGET_ADAPTERS.get(tc.type)
+        if spec is None:
             raise AdapterError(f"No adapter registered for target type '{tc.type}'.")
+        targets[name] = _adapter_class(*spec)(tc, config)
     return targets
 
 
@@ -109,7 +116,9 @@ def sync(
         sys.exit(EXIT_CONFIG_ERROR)
 
     if no_backup:
-        cfg.sync.backup = False
+        import dataclasses
+
+        cfg.sync = dataclasses.replace(cfg.sync, backup=False)
 
     try:
         source = create_source(cfg)
@@ -145,8 +154,9 @@ def sync(
 @main.command()
 @click.option("--verbose", "-v", is_flag=True, help="Show details for passed checks too.")
 @click.option("--target", "-t", help="Validate only a specific target agent.")
+@click.option("--fail-fast", is_flag=True, help="Stop after the first target that fails.")
 @click.pass_context
-def validate(ctx: click.Context, verbose: bool, target: str | None) -> None:
+def validate(ctx: click.Context, verbose: bool, target: str | None, fail_fast: bool) -> None:
     """Validate all generated agent configs against source of truth."""
     from agentsync.config import ConfigError, load
 
@@ -168,7 +178,7 @@ def validate(ctx: click.Context, verbose: bool, target: str | None) -> None:
     from agentsync.validate import Validator
 
     validator = Validator(cfg, source, targets)
-    report = validator.run(verbose=verbose, target_filter=target)
+    report = validator.run(verbose=verbose, target_filter=target, fail_fast=fail_fast)
 
     if not quiet:
         from agentsync.utils.output import print_validation_report
@@ -187,6 +197,8 @@ def validate(ctx: click.Context, verbose: bool, target: str | None) -> None:
 @click.option("--force", is_flag=True, help="Overwrite existing agentsync.yaml.")
 def init(force: bool) -> None:
     """Create an agentsync.yaml config file with sensible defaults."""
+    from pathlib import Path
+
     from agentsync.config import ConfigError, generate_default_config
 
     try:
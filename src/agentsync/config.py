@@ -2,22 +2,31 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+import os
+import stat
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Optional
 
-import yaml
+from agentsync.utils.compat import DATACLASS_SLOTS
 
 CONFIG_FILENAME = "agentsync.yaml"
-SUPPORTED_VERSIONS = {1}
-KNOWN_SOURCE_TYPES = {"claude"}
-KNOWN_TARGET_TYPES = {"cursor", "codex", "antigravity"}
+SUPPORTED_VERSIONS = frozenset({1})
+KNOWN_SOURCE_TYPES = frozenset({"claude"})
+KNOWN_TARGET_TYPES = frozenset({"cursor", "codex", "antigravity"})
+
+# "Supported: ..." suffixes for error messages, built once.
+_SUPPORTED_VERSIONS_MSG = str(sorted(SUPPORTED_VERSIONS))
+_SUPPORTED_SOURCES_MSG = ", ".join(sorted(KNOWN_SOURCE_TYPES))
+_SUPPORTED_TARGETS_MSG = ", ".join(sorted(KNOWN_TARGET_TYPES))
 
 
 # === Config Dataclasses ===
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SourceConfig:
     """Source of truth configuration."""
 
@@ -27,7 +36,20 @@ class SourceConfig:
     rules_file: str = "CLAUDE.md"
 
 
-@dataclass
+_SetCache = Optional[tuple[tuple[str, ...], frozenset[str]]]
+
+
+def _as_set(
+    cached: _SetCache, values: list[str], *, lower: bool = False
+) -> tuple[tuple[str, ...], frozenset[str]]:
+    """Return *cached* if it still matches *values*, else a fresh set of them."""
+    snapshot = tuple(values)
+    if cached is not None and cached[0] == snapshot:
+        return cached
+    return snapshot, frozenset(v.lower() for v in snapshot) if lower else frozenset(snapshot)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TargetConfig:
     """Single target agent configuration."""
 
@@ -39,24 +61,52 @@ class TargetConfig:
     exclude_servers: list[str] = field(default_factory=list)
     protocols: list[str] = field(default_factory=list)  # e.g. ["stdio"]
 
+    # (list snapshot, lowercased set) behind exclude_set / protocol_set.
+    _exclude_cache: _SetCache = field(default=None, init=False, repr=False, compare=False)
+    _protocol_cache: _SetCache = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def exclude_set(self) -> frozenset[str]:
+        """Lowercased ``exclude_servers``; rebuilt only when the list changes."""
+        self._exclude_cache = _as_set(self._exclude_cache, self.exclude_servers, lower=True)
+        return self._exclude_cache[1]
+
+    @property
+    def protocol_set(self) -> frozenset[str]:
+        """Lowercased ``protocols``; rebuilt only when the list changes."""
+        self._protocol_cache = _as_set(self._protocol_cache, self.protocols, lower=True)
+        return self._protocol_cache[1]
+
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class RulesConfig:
     """Rules filtering configuration."""
 
     exclude_sections: list[str] = field(default_factory=list)
 
+    # (list snapshot, header set) behind exclude_set.
+    _exclude_cache: _SetCache = field(default=None, init=False, repr=False, compare=False)
 
-@dataclass
+    @property
+    def exclude_set(self) -> frozenset[str]:
+        """``exclude_sections`` as a set; rebuilt only when the list changes."""
+        cache = _as_set(self._exclude_cache, self.exclude_sections)
+        # Frozen dataclass: the cache is the only attribute set after init.
+        object.__setattr__(self, "_exclude_cache", cache)
+        return cache[1]
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SyncOptions:
     """Sync behavior options."""
 
     backup: bool = True
     backup_dir: str = ".agentsync/backups"
     log_dir: str = ".agentsync/logs"
+    fsync: bool = False
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AgentSyncConfig:
     """Top-level agentsync configuration."""
 
@@ -82,10 +132,11 @@ class ConfigError(Exception):
 
 def resolve_path(path_str: str, base_dir: Path) -> Path:
     """Resolve a path string: expand ~ and make relative paths absolute."""
-    p = Path(path_str).expanduser()
-    if not p.is_absolute():
-        p = base_dir / p
-    return p
+    # String ops, so only the returned Path is allocated.
+    p = os.path.expanduser(path_str)
+    if not os.path.isabs(p):
+        p = os.path.join(base_dir, p)
+    return Path(p)
 
 
 # === Config Discovery ===
@@ -93,14 +144,16 @@ def resolve_path(path_str: str, base_dir: Path) -> Path:
 
 def find_config(start_dir: Path | None = None) -> Path | None:
     """Find agentsync.yaml by walking up from start_dir (or cwd)."""
-    current = (start_dir or Path.cwd()).resolve()
+    start = (start_dir or Path.cwd()).resolve()
 
+    # Walk with plain strings; a Path is only built for the hit.
+    current = os.fspath(start)
     while True:
-        candidate = current / CONFIG_FILENAME
-        if candidate.is_file():
-            return candidate
+        candidate = os.path.join(current, CONFIG_FILENAME)
+        if os.path.isfile(candidate):
+            return Path(candidate)
 
-        parent = current.parent
+        parent = os.path.dirname(current)
         if parent == current:
             return None  # Reached filesystem root
         current = parent
@@ -108,57 +161,77 @@ def find_config(start_dir: Path | None = None) -> Path | None:
 
 # === Parsing ===
 
+# Slotted classes have no class-level field defaults to read, so defaults
+# come from default instances instead.
+_SOURCE_DEFAULTS = SourceConfig()
+_SYNC_DEFAULTS = SyncOptions()
+
 
 def _parse_source(raw: dict[str, Any]) -> SourceConfig:
     source_type = raw.get("type", "claude")
     if source_type not in KNOWN_SOURCE_TYPES:
         raise ConfigError(
-            f"Unknown source type '{source_type}'. "
-            f"Supported: {', '.join(sorted(KNOWN_SOURCE_TYPES))}"
+            f"Unknown source type '{source_type}'. Supported: {_SUPPORTED_SOURCES_MSG}"
         )
     return SourceConfig(
         type=source_type,
-        global_config=raw.get("global_config", SourceConfig.global_config),
-        project_mcp=raw.get("project_mcp", SourceConfig.project_mcp),
-        rules_file=raw.get("rules_file", SourceConfig.rules_file),
+        global_config=raw.get("global_config", _SOURCE_DEFAULTS.global_config),
+        project_mcp=raw.get("project_mcp", _SOURCE_DEFAULTS.project_mcp),
+        rules_file=raw.get("rules_file", _SOURCE_DEFAULTS.rules_file),
     )
 
 
-def _parse_target(name: str, raw: dict[str, Any]) -> TargetConfig:
-    target_type = raw.get("type")
-    if not target_type:
+def _check_type(name: str, key: str, value: Any) -> str:
+    if not value:
         raise ConfigError(f"Target '{name}' is missing required field 'type'")
-    if target_type not in KNOWN_TARGET_TYPES:
+    if type(value) is not str or value not in KNOWN_TARGET_TYPES:
         raise ConfigError(
-            f"Target '{name}': unknown type '{target_type}'. "
-            f"Supported: {', '.join(sorted(KNOWN_TARGET_TYPES))}"
+            f"Target '{name}': unknown type '{value}'. Supported: {_SUPPORTED_TARGETS_MSG}"
         )
+    return value
 
-    rules_format = raw.get("rules_format", "md")
-    if rules_format not in ("md", "mdc"):
-        raise ConfigError(
-            f"Target '{name}': rules_format must be 'md' or 'mdc', got '{rules_format}'"
-        )
 
-    exclude_servers = raw.get("exclude_servers", [])
-    if not isinstance(exclude_servers, list) or not all(
-        isinstance(s, str) for s in exclude_servers
-    ):
-        raise ConfigError(f"Target '{name}': exclude_servers must be a list of strings")
-
-    protocols = raw.get("protocols", [])
-    if not isinstance(protocols, list) or not all(isinstance(p, str) for p in protocols):
-        raise ConfigError(f"Target '{name}': protocols must be a list of strings")
-
-    return TargetConfig(
-        type=target_type,
-        mcp_path=raw.get("mcp_path", ""),
-        config_path=raw.get("config_path", ""),
-        rules_path=raw.get("rules_path", ""),
-        rules_format=rules_format,
-        exclude_servers=exclude_servers,
-        protocols=protocols,
-    )
+def _check_path(name: str, key: str, value: Any) -> str:
+    if value is None:  # bare "key:" in YAML
+        return ""
+    if type(value) is not str:
+        raise ConfigError(f"Target '{name}': {key} must be a string")
+    return value
+
+
+def _check_rules_format(name: str, key: str, value: Any) -> str:
+    if type(value) is not str or value not in ("md", "mdc"):
+        raise ConfigError(f"Target '{name}': rules_format must be 'md' or 'mdc', got '{value}'")
+    return value
+
+
+def _check_string_list(name: str, key: str, value: Any) -> list[str]:
+    if type(value) is not list or any(type(v) is not str for v in value):
+        raise ConfigError(f"Target '{name}': {key} must be a list of strings")
+    return value
+
+
+# (field, default, check) for every TargetConfig field, in validation order.
+# Each check returns the value to store or raises ConfigError.
+_TARGET_SCHEMA: tuple[tuple[str, Any, Callable[[str, str, Any], Any]], ...] = (
+    ("type", None, _check_type),
+    ("mcp_path", "", _check_path),
+    ("config_path", "", _check_path),
+    ("rules_path", "", _check_path),
+    ("rules_format", "md", _check_rules_format),
+    ("exclude_servers", [], _check_string_list),
+    ("protocols", [], _check_string_list),
+)
+
+
+def _parse_target(name: str, raw: dict[str, Any]) -> TargetConfig:
+    kwargs = {
+        key: check(name, key, raw.get(key, default)) for key, default, check in _TARGET_SCHEMA
+    }
+    # Defaults are shared, so give each config its own lists.
+    kwargs["exclude_servers"] = list(kwargs["exclude_servers"])
+    kwargs["protocols"] = list(kwargs["protocols"])
+    return TargetConfig(**kwargs)
 
 
 def _parse_targets(raw: dict[str, Any]) -> dict[str, TargetConfig]:
@@ -172,8 +245,8 @@ def _parse_targets(raw: dict[str, Any]) -> dict[str, TargetConfig]:
 
 def _parse_rules(raw: dict[str, Any]) -> RulesConfig:
     exclude = raw.get("exclude_sections", [])
-    if not isinstance(exclude, list):
-        raise ConfigError("rules.exclude_sections must be a list")
+    if type(exclude) is not list or any(type(v) is not str for v in exclude):
+        raise ConfigError("rules.exclude_sections must be a list of strings")
     return RulesConfig(exclude_sections=exclude)
 
 
@@ -181,10 +254,14 @@ def _parse_sync_options(raw: dict[str, Any]) -> SyncOptions:
     backup = raw.get("backup", True)
     if not isinstance(backup, bool):
         raise ConfigError(f"sync.backup must be a boolean, got {type(backup).__name__}")
+    fsync = raw.get("fsync", _SYNC_DEFAULTS.fsync)
+    if not isinstance(fsync, bool):
+        raise ConfigError(f"sync.fsync must be a boolean, got {type(fsync).__name__}")
     return SyncOptions(
         backup=backup,
-        backup_dir=raw.get("backup_dir", SyncOptions.backup_dir),
-        log_dir=raw.get("log_dir", SyncOptions.log_dir),
+        backup_dir=raw.get("backup_dir", _SYNC_DEFAULTS.backup_dir),
+        log_dir=raw.get("log_dir", _SYNC_DEFAULTS.log_dir),
+        fsync=fsync,
     )
 
 
@@ -192,12 +269,36 @@ def _parse_sync_options(raw: dict[str, Any]) -> SyncOptions:
 
 
 def load_config(config_path: Path) -> AgentSyncConfig:
-    """Load and validate agentsync.yaml from a specific path."""
-    if not config_path.is_file():
+    """Load and validate agentsync.yaml from a specific path.
+
+    Parsed configs are memoized on the resolved path and the file's
+    identity, mtime and size; each call returns a fresh copy, so callers
+    may mutate the result freely.
+    """
+    try:
+        st = config_path.stat()
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         raise ConfigError(f"Config file not found: {config_path}")
 
+    # Resolve the directory only, so a symlinked file keeps its own config_dir.
+    resolved = config_path.parent.resolve() / config_path.name
+    cfg = _load_config_cached(resolved, st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+    return copy.deepcopy(cfg)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(
+    config_path: Path, dev: int, ino: int, mtime_ns: int, size: int
+) -> AgentSyncConfig:
+    # The stat fields are only part of the cache key.
+    import yaml
+
+    # libyaml's CSafeLoader is only present when PyYAML was built against it.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        raw = yaml.safe_load(config_path.read_text())
+        raw = yaml.load(config_path.read_bytes(), Loader=loader)
     except yaml.YAMLError as e:
         raise ConfigError(f"Invalid YAML in {config_path}: {e}") from e
 
@@ -212,11 +313,11 @@ def load_config(config_path: Path) -> AgentSyncConfig:
         raise ConfigError(f"'version' must be an integer, got {type(version).__name__}")
     if version not in SUPPORTED_VERSIONS:
         raise ConfigError(
-            f"Unsupported config version {version}. Supported: {sorted(SUPPORTED_VERSIONS)}"
+            f"Unsupported config version {version}. Supported: {_SUPPORTED_VERSIONS_MSG}"
         )
 
     # Parse sections
-    config_dir = config_path.parent.resolve()
+    config_dir = config_path.parent
 
     source = _parse_source(raw.get("source", {}))
     targets = _parse_targets(raw.get("targets", {}))
@@ -2,19 +2,28 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from agentsync.adapters.base import ServerConfig, WriteResult
+from agentsync.adapters.base import Section, ServerConfig, WriteResult
+from agentsync.config import resolve_path
+from agentsync.utils.compat import DATACLASS_SLOTS
 from agentsync.utils.dedup import dedup_servers
+from agentsync.utils.io import flush_to_disk
 from agentsync.utils.markdown import filter_sections
 
 if TYPE_CHECKING:
     from agentsync.adapters.base import SourceAdapter, TargetAdapter
     from agentsync.config import AgentSyncConfig
+    from agentsync.utils.logger import SyncLogger
 
+# Upper bound on threads used to write target files concurrently.
+_MAX_WRITE_WORKERS = 8
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class TargetSyncResult:
     """Outcome of syncing a single target."""
 
@@ -24,7 +33,7 @@ class TargetSyncResult:
     errors: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SyncResult:
     """Aggregate outcome of a full sync run."""
 
@@ -69,33 +78,45 @@ class SyncEngine:
         result = SyncResult(success=True, dry_run=dry_run)
 
         # Determine which targets to process
-        target_names = list(self._targets)
         if target_filter:
-            if target_filter not in self._targets:
+            only = self._targets.get(target_filter)
+            if only is None:
                 log.error(f"Unknown target '{target_filter}'")
                 result.success = False
                 return result
-            target_names = [target_filter]
+            selected = [(target_filter, only)]
+        else:
+            selected = list(self._targets.items())
+
+        # Servers and rules live in separate source files; read them concurrently.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            servers_future = None if rules_only else pool.submit(self._source.load_servers)
+            rules_future = None if mcp_only else pool.submit(self._source.load_rules)
 
         # --- MCP servers ---
         servers: dict[str, ServerConfig] = {}
-        if not rules_only:
+        if servers_future is not None:
             log.section("Loading MCP servers")
-            servers = self._source.load_servers()
-            servers = dedup_servers(servers, log)
+            servers = dedup_servers(servers_future.result(), log)
             log.info(f"Total: {len(servers)} unique servers after dedup")
 
         # --- Rules (sections) ---
-        all_sections = []
-        if not mcp_only:
+        all_sections: list[Section] = []
+        filtered_sections: list[Section] = []
+        if rules_future is not None:
             log.section("Loading rules")
-            all_sections = self._source.load_rules()
+            all_sections = rules_future.result()
             log.info(f"Loaded {len(all_sections)} sections from source")
-
-        # --- Per-target processing ---
-        for name in target_names:
-            target = self._targets[name]
+            # The exclude list is global, so every target gets the same sections.
+            filtered_sections = filter_sections(all_sections, self._config.rules.exclude_set)
+
+        # --- Per-target generation ---
+        # Generation runs in order on this thread so log output stays grouped
+        # under each target's section.
+        to_write: list[tuple[TargetSyncResult, TargetAdapter]] = []
+        for name, target in selected:
             tr = TargetSyncResult(target_name=name, success=True)
+            result.target_results[name] = tr
 
             log.section(f"Target: {name}")
 
@@ -110,55 +131,132 @@ class SyncEngine:
 
                 # Rules
                 if not mcp_only and all_sections:
-                    exclude_set = set(self._config.rules.exclude_sections)
-                    filtered = filter_sections(all_sections, exclude_set)
                     log.info(
-                        f"{len(filtered)}/{len(all_sections)} sections after filtering for {name}"
+                        f"{len(filtered_sections)}/{len(all_sections)} sections "
+                        f"after filtering for {name}"
                     )
-                    target.generate_rules(filtered)
-
-                # Write
-                writes = target.write(dry_run=dry_run)
-                tr.writes = writes
+                    target.generate_rules(filtered_sections)
 
             except Exception as exc:  # noqa: BLE001
                 tr.success = False
                 tr.errors.append(str(exc))
                 log.error(f"{name}: {exc}")
+            else:
+                to_write.append((tr, target))
+
+        # --- Write ---
+        self._write_targets(to_write, dry_run, log)
+        flushed = True
+        if self._config.sync.fsync and not dry_run:
+            # Flush after the write phase, so the writes themselves stay parallel.
+            try:
+                flush_to_disk([w.path for tr, _t in to_write for w in tr.writes if w.written])
+            except OSError as exc:
+                flushed = False
+                log.error(f"fsync failed: {exc}")
 
-            result.target_results[name] = tr
-            if not tr.success:
-                result.success = False
-
+        result.success = flushed and all(tr.success for tr in result.target_results.values())
         return result
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _write_targets(
+        self,
+        pending: list[tuple[TargetSyncResult, TargetAdapter]],
+        dry_run: bool,
+        log: SyncLogger,
+    ) -> None:
+        """Write every target in *pending*, concurrently when there are several.
+
+        Targets whose configured output paths overlap are written one after
+        another in config order; only independent groups run in parallel.
+        Outcomes are recorded (and errors logged) in the original target order.
+        """
+        if not pending:
+            return
+
+        def write_group(group: list[TargetAdapter]) -> list[list[WriteResult] | Exception]:
+            outcomes: list[list[WriteResult] | Exception] = []
+            for target in group:
+                try:
+                    outcomes.append(target.write(dry_run=dry_run))
+                except Exception as exc:  # noqa: BLE001
+                    outcomes.append(exc)
+            return outcomes
+
+        groups = self._group_by_output(pending)
+        with ThreadPoolExecutor(max_workers=min(len(groups), _MAX_WRITE_WORKERS)) as pool:
+            futures = [pool.submit(write_group, [pending[i][1] for i in g]) for g in groups]
+
+        outcomes: dict[int, list[WriteResult] | Exception] = {}
+        for group, future in zip(groups, futures):
+            outcomes.update(zip(group, future.result()))
+
+        for i, (tr, _target) in enumerate(pending):
+            outcome = outcomes[i]
+            if isinstance(outcome, Exception):
+                tr.success = False
+                tr.errors.append(str(outcome))
+                log.error(f"{tr.target_name}: {outcome}")
+            else:
+                tr.writes = outcome
+
+    def _group_by_output(
+        self, pending: list[tuple[TargetSyncResult, TargetAdapter]]
+    ) -> list[list[int]]:
+        """Group indexes into *pending* by shared output files.
+
+        Targets are linked when any of their configured paths resolve to the
+        same file; each group lists its indexes in config order.
+        """
+        groups: list[tuple[set[str], list[int]]] = []
+        for i, (tr, _target) in enumerate(pending):
+            paths = self._output_paths(tr.target_name)
+            members = [i]
+            for group in [g for g in groups if g[0] & paths]:
+                groups.remove(group)
+                paths |= group[0]
+                members += group[1]
+            groups.append((paths, sorted(members)))
+        return [members for _paths, members in groups]
+
+    def _output_paths(self, target_name: str) -> set[str]:
+        """Resolved files *target_name* may write, per its config."""
+        target_cfg = self._config.targets.get(target_name)
+        if target_cfg is None:
+            return set()
+        return {
+            os.path.realpath(resolve_path(p, self._config.config_dir))
+            for p in (target_cfg.mcp_path, target_cfg.config_path, target_cfg.rules_path)
+            if p
+        }
+
     def _filter_servers(
         self,
         servers: dict[str, ServerConfig],
         target_name: str,
     ) -> dict[str, ServerConfig]:
-        """Apply per-target exclude_servers and protocol filtering."""
+        """Apply per-target exclude_servers and protocol filtering.
+
+        *servers* must come from :func:`dedup_servers`, so keys are already
+        lowercase and are compared to the exclude list as-is.
+        """
         target_cfg = self._config.targets.get(target_name)
         if target_cfg is None:
             return servers
 
-        exclude = {s.lower() for s in target_cfg.exclude_servers}
-        protocols = {p.lower() for p in target_cfg.protocols}
-
-        filtered: dict[str, ServerConfig] = {}
-        for key, sc in servers.items():
-            if key.lower() in exclude:
-                continue
-            if protocols:
-                matches = ("stdio" in protocols and sc.is_stdio) or (
-                    "http" in protocols and sc.is_http
-                )
-                if not matches:
-                    continue
-            filtered[key] = sc
-
-        return filtered
+        exclude = target_cfg.exclude_set
+        protocols = target_cfg.protocol_set
+
+        if not protocols:
+            return {k: sc for k, sc in servers.items() if k not in exclude}
+
+        want_stdio = "stdio" in protocols
+        want_http = "http" in protocols
+        return {
+            k: sc
+            for k, sc in servers.items()
+            if k not in exclude and ((want_stdio and sc.is_stdio) or (want_http and sc.is_http))
+        }
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import os
 import shutil
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -11,19 +12,38 @@ if TYPE_CHECKING:
     from agentsync.utils.logger import SyncLogger
 
 
-def backup_file(path: Path, backup_dir: Path, log: SyncLogger) -> Path | None:
+def backup_file(
+    path: Path,
+    backup_dir: Path,
+    log: SyncLogger,
+    new_content: bytes | None = None,
+) -> Path | None:
     """Create a timestamped backup of *path* inside *backup_dir*.
 
+    When *new_content* is given and matches the current file, nothing is
+    about to change and no backup is made.
+
+    The backup is a hard link when the filesystem allows it, so callers
+    must replace *path* (e.g. write a temp file and rename it) rather than
+    rewrite it in place.  Otherwise the file is copied.
+
     Returns the backup path on success, or ``None`` if the source file
-    does not exist.
+    does not exist or no backup was needed.
     """
     if not path.exists():
         return None
+    if new_content is not None and path.read_bytes() == new_content:
+        return None
 
     backup_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     backup_name = f"{path.name}.{timestamp}.bak"
     backup_path = backup_dir / backup_name
-    shutil.copy2(path, backup_path)
+    # A same-second rerun reuses the name; link() will not overwrite.
+    backup_path.unlink(missing_ok=True)
+    try:
+        os.link(path, backup_path)
+    except OSError:  # cross-device, or no hard links on this filesystem
+        shutil.copy2(path, backup_path)
     log.info(f"Backup: {path} -> {backup_path}")
     return backup_path
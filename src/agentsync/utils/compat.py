@@ -0,0 +1,10 @@
+"""Helpers for features that depend on the running Python version."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+# ``@dataclass(**DATACLASS_SLOTS)`` gives slotted instances (no per-object
+# ``__dict__``) on Python 3.10+, and plain dataclasses on 3.9.
+DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
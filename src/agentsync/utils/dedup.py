@@ -12,21 +12,28 @@ if TYPE_CHECKING:
 
 def dedup_servers(
     servers: dict[str, ServerConfig],
-    log: SyncLogger,
+    log: SyncLogger | None = None,
 ) -> dict[str, ServerConfig]:
     """Deduplicate servers by case-insensitive key comparison.
 
     When two keys differ only by case (e.g. ``Notion`` vs ``notion``),
-    the later entry wins.  All returned keys are lowercase.
+    the later entry wins.  All returned keys are lowercase.  Replacements
+    are reported through *log* when one is given.
     """
-    seen: dict[str, tuple[str, ServerConfig]] = {}
+    out = {key.lower(): sc for key, sc in servers.items()}
+    if len(out) == len(servers):
+        return out  # No case collisions, nothing to report
+
+    out = {}
+    orig_keys: dict[str, str] = {}
 
     for key, sc in servers.items():
         lower = key.lower()
-        if lower in seen:
-            prev_key = seen[lower][0]
-            if prev_key != key:
-                log.warn(f"Dedup: '{prev_key}' replaced by '{key}' (case-insensitive merge)")
-        seen[lower] = (key, sc)
-
-    return {lower: sc for lower, (_orig, sc) in seen.items()}
+        prev_key = orig_keys.get(lower)
+        # Input keys are unique, so any earlier hit differs from *key* by case.
+        if prev_key is not None and log is not None:
+            log.warn(f"Dedup: '{prev_key}' replaced by '{key}' (case-insensitive merge)")
+        orig_keys[lower] = key
+        out[lower] = sc
+
+    return out
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from agentsync.adapters.base import ServerConfig
+from agentsync.utils import json_fast
 
 if TYPE_CHECKING:
     from agentsync.utils.logger import SyncLogger
@@ -21,16 +21,17 @@ def show_server_diff(
     """Log which servers are added/removed compared to an existing JSON file."""
     new_names = set(new_servers)
 
-    if not existing_path.exists():
+    try:
+        raw = existing_path.read_bytes()
+    except FileNotFoundError:
         log.info(
             f"{target_name}: file doesn't exist yet, will create with {len(new_names)} servers"
         )
         return
 
     try:
-        data = json.loads(existing_path.read_text())
-        existing_names: set[str] = set(data.get("mcpServers", {}))
-    except (json.JSONDecodeError, KeyError):
+        existing_names = json_fast.member_keys(raw, "mcpServers")
+    except json_fast.DecodeError:
         existing_names = set()
 
     added = new_names - existing_names
@@ -2,16 +2,29 @@
 
 from __future__ import annotations
 
-import json
+import os
+import secrets
+import stat
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from agentsync.adapters.base import WriteResult
+from agentsync.utils import json_fast
 from agentsync.utils.backup import backup_file
 
 if TYPE_CHECKING:
     from agentsync.utils.logger import SyncLogger
 
+try:
+    import fcntl
+
+    _F_FULLFSYNC: int | None = getattr(fcntl, "F_FULLFSYNC", None)
+except ImportError:  # Windows
+    _F_FULLFSYNC = None
+
+# Windows only flushes handles opened for writing.
+_FSYNC_FILE_FLAGS = os.O_RDWR if os.name == "nt" else os.O_RDONLY
+
 
 def write_json(
     path: Path,
@@ -24,16 +37,9 @@ def write_json(
 
     Returns a :class:`WriteResult` describing the outcome.
     """
-    content = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
-
-    # Validate round-trip
-    try:
-        json.loads(content)
-    except json.JSONDecodeError as e:
-        msg = f"JSON validation failed for {path}: {e}"
-        log.error(msg)
-        return WriteResult(path=str(path), written=False, message=msg)
-
+    # The serializer only emits valid JSON (or raises), so the output is
+    # written as-is without re-parsing it.
+    content = json_fast.dumps(data) + b"\n"
     return _write(path, content, log, backup_dir=backup_dir, dry_run=dry_run)
 
 
@@ -43,12 +49,48 @@ def write_text(
     log: SyncLogger,
     backup_dir: Path | None = None,
     dry_run: bool = False,
+    *,
+    existing: bytes | None = None,
 ) -> WriteResult:
     """Write plain text to *path*.
 
+    Callers that already read the current file (e.g. to merge into it) can
+    pass its bytes as *existing* to skip reading it again.
+
     Returns a :class:`WriteResult` describing the outcome.
     """
-    return _write(path, content, log, backup_dir=backup_dir, dry_run=dry_run)
+    return _write(
+        path,
+        content.encode("utf-8"),
+        log,
+        backup_dir=backup_dir,
+        dry_run=dry_run,
+        existing=existing,
+    )
+
+
+def read_existing(path: Path) -> bytes | None:
+    """Return the bytes of *path*, or ``None`` if it does not exist."""
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def flush_to_disk(paths: list[str]) -> None:
+    """Make the files at *paths*, and the renames that put them there, durable.
+
+    Each file is fsynced, then each containing directory once.  Only the
+    given files are flushed, not the whole system.
+    """
+    dirs: dict[str, None] = {}
+    for p in dict.fromkeys(paths):
+        real = os.path.realpath(p)
+        _fsync_path(real, _FSYNC_FILE_FLAGS)
+        dirs[os.path.dirname(real)] = None
+    if os.name != "nt":  # Windows cannot open directories for fsync
+        for d in dirs:
+            _fsync_path(d, os.O_RDONLY)
 
 
 # ------------------------------------------------------------------
@@ -58,31 +100,118 @@ def write_text(
 
 def _write(
     path: Path,
-    content: str,
+    content: bytes,
     log: SyncLogger,
     *,
     backup_dir: Path | None,
     dry_run: bool,
+    existing: bytes | None = None,
 ) -> WriteResult:
-    nbytes = len(content.encode())
+    nbytes = len(content)
+
+    if existing is not None:
+        exists = True
+    else:
+        exists, existing = _read_if_size(path, nbytes)
+
+    # Identical content: no write, no backup, no mtime bump.
+    if existing == content:
+        msg = f"{path}: no changes"
+        log.info(msg)
+        return WriteResult(path=str(path), written=False, bytes_written=0, message=msg)
 
     if dry_run:
-        if path.exists():
-            existing = path.read_text()
-            if existing == content:
-                msg = f"{path}: no changes"
-            else:
-                msg = f"{path}: WOULD UPDATE ({nbytes} bytes)"
-        else:
-            msg = f"{path}: WOULD CREATE ({nbytes} bytes)"
+        verb = "WOULD UPDATE" if exists else "WOULD CREATE"
+        msg = f"{path}: {verb} ({nbytes} bytes)"
         log.info(msg)
         return WriteResult(path=str(path), written=False, bytes_written=0, message=msg)
 
-    if backup_dir is not None:
+    if backup_dir is not None and exists:
         backup_file(path, backup_dir, log)
 
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content)
+    _replace_atomically(path, content)
     msg = f"Written: {path} ({nbytes} bytes)"
     log.info(msg)
     return WriteResult(path=str(path), written=True, bytes_written=nbytes, message=msg)
+
+
+def _read_if_size(path: Path, size: int) -> tuple[bool, bytes | None]:
+    """Return whether *path* exists, and its bytes if it is *size* long.
+
+    A file of any other size cannot match, so it is not read.
+    """
+    try:
+        if os.stat(path).st_size != size:
+            return True, None
+        return True, path.read_bytes()
+    except FileNotFoundError:
+        return False, None
+
+
+def _fsync_path(path: str, flags: int) -> None:
+    """fsync *path*, using ``F_FULLFSYNC`` where plain fsync is not enough.
+
+    On macOS fsync() leaves data in the drive's write cache;
+    ``F_FULLFSYNC`` flushes that too.
+    """
+    fd = os.open(path, flags)
+    try:
+        if _F_FULLFSYNC is not None:
+            try:
+                fcntl.fcntl(fd, _F_FULLFSYNC)
+                return
+            except OSError:  # not supported by this filesystem
+                pass
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _replace_atomically(path: Path, content: bytes) -> None:
+    """Write *content* to a sibling temp file, then rename it over *path*.
+
+    Symlinks are followed so the link itself survives, and an existing
+    file's permission bits are carried over to the replacement.  The temp
+    file gets those bits before any content is written, so a private file
+    is never briefly readable by others.
+    """
+    real = Path(os.path.realpath(path))
+    try:
+        mode: int | None = stat.S_IMODE(real.stat().st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    try:
+        tmp, fd = _create_temp(real, mode)
+    except FileNotFoundError:
+        # Parent directories are created only when missing, which saves
+        # a mkdir() walk up the tree on every write to an existing location.
+        real.parent.mkdir(parents=True, exist_ok=True)
+        tmp, fd = _create_temp(real, mode)
+    try:
+        with open(fd, "wb") as f:
+            if mode is not None:
+                # Creation masked the mode with the umask; restore it exactly.
+                os.chmod(tmp, mode)
+            f.write(content)
+        os.replace(tmp, real)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _create_temp(real: Path, mode: int | None) -> tuple[Path, int]:
+    """Exclusively create a uniquely named temp file next to *real*.
+
+    Each writer gets its own file, so concurrent writers (threads or
+    separate processes) never share one.  Unlike :func:`tempfile.mkstemp`,
+    which always uses 0600, the file is created with *mode* (or the usual
+    0666 for new files), minus the umask.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        tmp = real.with_name(f".{real.name}.{secrets.token_hex(4)}.agentsync-tmp")
+        try:
+            return tmp, os.open(tmp, flags, 0o666 if mode is None else mode)
+        except FileExistsError:
+            continue
@@ -0,0 +1,99 @@
+"""JSON (de)serialization, using ``orjson`` when installed.
+
+Results never depend on whether ``orjson`` is present: anything it would
+read or write differently from the stdlib ``json`` module (``NaN``,
+integers beyond 64 bits, float formatting, non-JSON types) is handed to
+``json`` instead.  Both accept ``bytes`` input directly, so callers should
+pass raw file contents to :func:`loads` instead of decoding first.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+# Every backend raises a ValueError subclass on malformed input
+# (json.JSONDecodeError, orjson.JSONDecodeError, UnicodeDecodeError).
+DecodeError = ValueError
+
+
+def _loads_stdlib(data: bytes | str) -> Any:
+    return json.loads(data)
+
+
+def _dumps_stdlib(obj: Any) -> bytes:
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+try:
+    import orjson
+
+    BACKEND = "orjson"
+
+    # orjson reads integers outside the 64-bit range as floats; any run of
+    # 19+ digits might be one, so such input goes to the stdlib parser.
+    _LONG_DIGITS = re.compile(r"[0-9]{19}")
+    _LONG_DIGITS_BYTES = re.compile(rb"[0-9]{19}")
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON from *data*."""
+        if isinstance(data, str):
+            long_digits = _LONG_DIGITS.search(data) is not None
+        else:
+            long_digits = _LONG_DIGITS_BYTES.search(data) is not None
+        if not long_digits:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # NaN/Infinity, a BOM, lone surrogates: accepted by json, or
+                # genuinely malformed and re-raised by it.
+                pass
+        return _loads_stdlib(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize *obj* as 2-space indented UTF-8 JSON."""
+        if _orjson_matches_stdlib(obj):
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        return _dumps_stdlib(obj)
+
+    def _orjson_matches_stdlib(obj: Any) -> bool:
+        """True if orjson serializes *obj* byte-for-byte like :func:`_dumps_stdlib`.
+
+        Only plain dicts (with str keys), lists, strings, bools, ``None`` and
+        64-bit ints qualify; floats are formatted differently (``1e100`` vs
+        ``1e+100``, ``NaN`` as ``null``) and subclasses, tuples and other
+        types are accepted by only one of the two.
+        """
+        t = type(obj)
+        if t is str or t is bool or obj is None:
+            return True
+        if t is int:
+            return bool(-(2**63) <= obj < 2**64)
+        if t is dict:
+            return all(type(k) is str and _orjson_matches_stdlib(v) for k, v in obj.items())
+        if t is list:
+            return all(_orjson_matches_stdlib(v) for v in obj)
+        return False
+
+except ImportError:
+    BACKEND = "json"
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON from *data*."""
+        return _loads_stdlib(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize *obj* as 2-space indented UTF-8 JSON."""
+        return _dumps_stdlib(obj)
+
+
+def member_keys(data: bytes, member: str) -> set[str]:
+    """Return the keys of the top-level object *member* in JSON *data*.
+
+    Missing or non-object members yield an empty set.  Raises
+    :data:`DecodeError` on malformed input.
+    """
+    doc = loads(data)
+    node = doc.get(member) if isinstance(doc, dict) else None
+    return set(node) if isinstance(node, dict) else set()
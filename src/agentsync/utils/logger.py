@@ -2,51 +2,72 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from rich.console import Console
-from rich.rule import Rule
+if TYPE_CHECKING:
+    from rich.console import Console
 
 
 class SyncLogger:
     """Logger with rich console output and optional file flushing."""
 
+    _INFO = "  [green]INFO[/green]  "
+    _WARN = "  [yellow]WARN[/yellow]  "
+    _ERROR = "  [red]ERROR[/red] "
+
     def __init__(self, dry_run: bool = False, quiet: bool = False) -> None:
         self.dry_run = dry_run
         self.quiet = quiet
-        self._console = Console(quiet=quiet)
+        self._console: Console | None = None  # created on first output
         self._buffer: list[str] = []
 
+    def _print(self, renderable: Any) -> None:
+        if self.quiet:
+            return
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        self._console.print(renderable)
+
     def _record(self, msg: str, level: str = "INFO") -> None:
         prefix = "[DRY-RUN] " if self.dry_run else ""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = time.strftime("%H:%M:%S")
         self._buffer.append(f"[{timestamp}] [{level}] {prefix}{msg}")
 
     def info(self, msg: str) -> None:
         self._record(msg, "INFO")
-        self._console.print(f"  [green]INFO[/green]  {msg}")
+        if not self.quiet:
+            self._print(self._INFO + msg)
 
     def warn(self, msg: str) -> None:
         self._record(msg, "WARN")
-        self._console.print(f"  [yellow]WARN[/yellow]  {msg}")
+        if not self.quiet:
+            self._print(self._WARN + msg)
 
     def error(self, msg: str) -> None:
         self._record(msg, "ERROR")
-        self._console.print(f"  [red]ERROR[/red] {msg}")
+        if not self.quiet:
+            self._print(self._ERROR + msg)
 
     def section(self, title: str) -> None:
         self._record(f"=== {title} ===")
-        self._console.print(Rule(title))
+        if not self.quiet:
+            from rich.rule import Rule
+
+            self._print(Rule(title))
 
     def flush_to_file(self, log_dir: Path) -> None:
-        """Write buffered messages to a dated log file."""
+        """Append buffered messages to a dated log file and clear the buffer."""
         if not self._buffer:
             return
         log_dir.mkdir(parents=True, exist_ok=True)
-        log_file = log_dir / f"sync-{datetime.now().strftime('%Y-%m-%d')}.log"
-        with open(log_file, "a") as f:
-            f.write("\n".join(self._buffer) + "\n")
+        log_file = log_dir / f"sync-{time.strftime('%Y-%m-%d')}.log"
+        with open(log_file, "a", encoding="utf-8", buffering=1 << 16) as f:
+            f.writelines(line + "\n" for line in self._buffer)
+        self._buffer.clear()
 
 
 class SilentLogger(SyncLogger):
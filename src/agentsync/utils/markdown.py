@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Iterable, Iterator, Set
+
 from agentsync.adapters.base import Section
 
+# ``##`` or ``###`` followed by a space at the start of a line.  The
+# required space keeps ``####`` and ``##text`` from matching.
+_HEADER_RE = re.compile(r"^(#{2,3}) (.*)$", re.MULTILINE)
+
 
 def parse_markdown_sections(content: str) -> list[Section]:
     """Parse markdown *content* into a flat list of :class:`Section` objects.
@@ -11,62 +18,23 @@ def parse_markdown_sections(content: str) -> list[Section]:
     Recognises ``##`` (level 2) and ``###`` (level 3) headers.  Content
     before the first header (the preamble) is silently discarded.
     """
-    lines = content.split("\n")
-    sections: list[Section] = []
-    current_header: str | None = None
-    current_level: int = 0
-    current_lines: list[str] = []
-
-    for line in lines:
-        if line.startswith("### "):
-            # Flush previous section
-            if current_header is not None:
-                sections.append(
-                    Section(
-                        header=current_header,
-                        level=current_level,
-                        content="\n".join(current_lines),
-                    )
-                )
-            current_header = line[4:].strip()
-            current_level = 3
-            current_lines = [line]
-        elif line.startswith("## "):
-            if current_header is not None:
-                sections.append(
-                    Section(
-                        header=current_header,
-                        level=current_level,
-                        content="\n".join(current_lines),
-                    )
-                )
-            current_header = line[3:].strip()
-            current_level = 2
-            current_lines = [line]
-        elif current_header is not None:
-            current_lines.append(line)
-
-    # Flush last section
-    if current_header is not None:
-        sections.append(
-            Section(
-                header=current_header,
-                level=current_level,
-                content="\n".join(current_lines),
-            )
-        )
-
-    return sections
-
-
-def filter_sections(sections: list[Section], exclude_set: set[str]) -> list[Section]:
-    """Filter out sections whose headers appear in *exclude_set*.
+    matches = list(_HEADER_RE.finditer(content))
+    # A section runs up to the newline that ends the line before the next header.
+    ends = [m.start() - 1 for m in matches[1:]]
+    ends.append(len(content))
+    return [
+        Section(header=m.group(2).strip(), level=len(m.group(1)), content=content[m.start() : end])
+        for m, end in zip(matches, ends)
+    ]
+
+
+def iter_filter_sections(sections: Iterable[Section], exclude_set: Set[str]) -> Iterator[Section]:
+    """Yield the sections of *sections* whose headers are not in *exclude_set*.
 
     When a level-2 (``##``) section is excluded, all its level-3 children
     are excluded too.  A level-3 section listed explicitly is removed on
     its own without affecting siblings.
     """
-    filtered: list[Section] = []
     skip_parent = False
 
     for section in sections:
@@ -86,6 +54,9 @@ def filter_sections(sections: list[Section], exclude_set: set[str]) -> list[Sect
         if section.header in exclude_set:
             continue
 
-        filtered.append(section)
+        yield section
+
 
-    return filtered
+def filter_sections(sections: list[Section], exclude_set: Set[str]) -> list[Section]:
+    """List form of :func:`iter_filter_sections`."""
+    return list(iter_filter_sections(sections, exclude_set))
@@ -9,48 +9,53 @@ from rich.console import Console
 from rich.table import Table
 
 if TYPE_CHECKING:
-    from agentsync.adapters.base import SourceAdapter, TargetAdapter
+    from agentsync.adapters.base import ServerConfig, SourceAdapter, TargetAdapter
     from agentsync.config import AgentSyncConfig
     from agentsync.sync import SyncResult
     from agentsync.validate import ValidationReport
 
 
+def _plural(n: int) -> str:
+    """Return the ``s`` suffix for a count of *n*."""
+    return "" if n == 1 else "s"
+
+
 def print_sync_summary(result: SyncResult, console: Console | None = None) -> None:
     """Print a coloured summary of sync results."""
     con = console or Console()
 
     total_files = 0
     total_errors = 0
-
-    for tr in result.target_results.values():
-        total_files += sum(1 for w in tr.writes if w.written)
-        total_errors += len(tr.errors)
-
-    n_targets = len(result.target_results)
-    header = f"Sync complete: {n_targets} target{'s' if n_targets != 1 else ''}"
-    header += f", {total_files} file{'s' if total_files != 1 else ''} written"
-    if total_errors:
-        header += f", [red]{total_errors} error{'s' if total_errors != 1 else ''}[/red]"
-    else:
-        header += ", 0 errors"
-
-    con.print()
-    con.print(header)
+    rows: list[str] = []
 
     for name, tr in result.target_results.items():
         n_written = sum(1 for w in tr.writes if w.written)
+        total_files += n_written
+        total_errors += len(tr.errors)
         if tr.success:
             mark = "[green]\u2713[/green]"
-            detail = f"{n_written} file{'s' if n_written != 1 else ''}"
+            detail = f"{n_written} file{_plural(n_written)}"
         else:
             mark = "[red]\u2717[/red]"
             detail = "; ".join(tr.errors) if tr.errors else "failed"
 
-        con.print(f"  {name:<16} {mark}  {detail}")
+        rows.append(f"  {name:<16} {mark}  {detail}")
+
+    n_targets = len(result.target_results)
+    header = f"Sync complete: {n_targets} target{_plural(n_targets)}"
+    header += f", {total_files} file{_plural(total_files)} written"
+    if total_errors:
+        header += f", [red]{total_errors} error{_plural(total_errors)}[/red]"
+    else:
+        header += ", 0 errors"
+
+    lines = ["", header, *rows]
 
     if result.dry_run:
-        con.print()
-        con.print("[yellow]DRY RUN \u2014 no files were written[/yellow]")
+        lines.append("")
+        lines.append("[yellow]DRY RUN \u2014 no files were written[/yellow]")
+
+    con.print("\n".join(lines))
 
 
 def print_validation_report(
@@ -61,18 +66,22 @@ def print_validation_report(
     """Print a coloured validation report."""
     con = console or Console()
 
-    passed = sum(1 for r in report.results if r.passed)
-    failed = sum(1 for r in report.results if not r.passed)
-
-    con.print()
+    passed = failed = 0
+    lines = [""]
 
     for r in report.results:
-        if r.passed and not verbose:
-            continue
-        mark = "[green]\u2713[/green]" if r.passed else "[red]\u2717[/red]"
-        con.print(f"  {mark} {r.name}: {r.message}")
+        if r.passed:
+            passed += 1
+            if not verbose:
+                continue
+            mark = "[green]\u2713[/green]"
+        else:
+            failed += 1
+            mark = "[red]\u2717[/red]"
+        lines.append(f"  {mark} {r.name}: {r.message}")
 
-    con.print()
+    lines.append("")
+    con.print("\n".join(lines))
     parts = []
     if passed:
         parts.append(f"[green]{passed} passed[/green]")
@@ -101,13 +110,18 @@ def print_status(
 
     project_mcp = resolve_path(config.source.project_mcp, config.config_dir)
     server_count = None
-    if project_mcp.is_file():
+    servers: dict[str, ServerConfig] | None = None
+    project_mcp_exists = project_mcp.is_file()
+    if project_mcp_exists:
         try:
             servers = source.load_servers()
             server_count = len(servers)
         except Exception:  # noqa: BLE001
+            servers = None
             server_count = None
-    _print_path_status(con, "Project MCP", project_mcp, extra_count=server_count)
+    _print_path_status(
+        con, "Project MCP", project_mcp, extra_count=server_count, exists=project_mcp_exists
+    )
 
     rules_path = resolve_path(config.source.rules_file, config.config_dir)
     _print_path_status(con, "Rules", rules_path)
@@ -116,30 +130,36 @@ def print_status(
     con.print()
     con.print("[bold]Targets:[/bold]")
 
-    table = Table(show_header=True, show_edge=False, pad_edge=False, box=None)
-    table.add_column("Name", style="cyan", min_width=14)
-    table.add_column("Status", min_width=10)
-    table.add_column("Details")
-
+    rows: list[tuple[str, str, str]] = []
     for name, target in targets.items():
         try:
-            results = target.validate()
-            all_pass = all(r.passed for r in results)
+            results = target.validate(servers)
+            n_fail = 0
+            for r in results:
+                if not r.passed:
+                    n_fail += 1
             if not results:
                 mark = "[yellow]\u26a0[/yellow]"
                 detail = "no validation checks"
-            elif all_pass:
+            elif not n_fail:
                 mark = "[green]\u2713[/green]"
-                detail = f"{len(results)} check{'s' if len(results) != 1 else ''} passed"
+                detail = f"{len(results)} check{_plural(len(results))} passed"
             else:
-                n_fail = sum(1 for r in results if not r.passed)
                 mark = "[red]\u2717[/red]"
-                detail = f"{n_fail} check{'s' if n_fail != 1 else ''} failed"
+                detail = f"{n_fail} check{_plural(n_fail)} failed"
         except Exception as exc:  # noqa: BLE001
             mark = "[red]\u2717[/red]"
             detail = str(exc)
 
-        table.add_row(name, mark, detail)
+        rows.append((name, mark, detail))
+
+    table = Table(show_header=True, show_edge=False, pad_edge=False, box=None)
+    table.add_column("Name", style="cyan", min_width=14)
+    table.add_column("Status", min_width=10)
+    # Fold long unbroken details (paths in error messages) instead of truncating them.
+    table.add_column("Details", overflow="fold")
+    for row in rows:
+        table.add_row(*row)
 
     con.print(table)
 
@@ -150,9 +170,15 @@ def _print_path_status(
     path: Path,
     *,
     extra_count: int | None = None,
+    exists: bool | None = None,
 ) -> None:
-    """Print a source path with exists/missing indicator."""
-    if path.is_file():
+    """Print a source path with exists/missing indicator.
+
+    Pass *exists* when the caller has already checked the path.
+    """
+    if exists is None:
+        exists = path.is_file()
+    if exists:
         suffix = f" ({extra_count} servers)" if extra_count is not None else ""
         con.print(f"  {label + ':':<18} {path} [green](exists{suffix})[/green]")
     else:
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Mapping, Set
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from agentsync.adapters.base import ServerConfig, ValidationResult
+from agentsync.utils.compat import DATACLASS_SLOTS
 
 if TYPE_CHECKING:
     from agentsync.adapters.base import SourceAdapter, TargetAdapter
@@ -18,25 +21,36 @@ if TYPE_CHECKING:
 
 
 def check_server_consistency(
-    expected: dict[str, ServerConfig],
-    actual_names: set[str],
+    expected: Mapping[str, ServerConfig],
+    actual_names: Set[str],
     target_name: str,
-    exclude: set[str],
+    exclude: Set[str],
     stdio_only: bool = False,
 ) -> ValidationResult:
     """Check that *actual_names* contains every expected server.
 
     When *stdio_only* is ``True`` only stdio servers from *expected* are
-    considered.
+    considered.  Servers are excluded by their mapping key in *expected*,
+    compared case-insensitively with *exclude*.
     """
-    expected_names: set[str] = set()
-    for k, sc in expected.items():
-        if k.lower() in {e.lower() for e in exclude}:
-            continue
-        if stdio_only and not sc.is_stdio:
-            continue
-        expected_names.add(k)
+    exclude_lower = {e.lower() for e in exclude}
+    expected_names = frozenset(
+        k
+        for k, sc in expected.items()
+        if (not stdio_only or sc.is_stdio) and not (exclude_lower and k.lower() in exclude_lower)
+    )
+
+    name = f"{target_name} server consistency"
+    n_expected = len(expected_names)
+    if expected_names == actual_names:
+        return ValidationResult(
+            name=name,
+            passed=True,
+            message=f"{n_expected}/{n_expected} expected servers present",
+            severity="info",
+        )
 
+    # Set differences run in C; both are needed for the message.
     missing = expected_names - actual_names
     extra = actual_names - expected_names
 
@@ -48,17 +62,15 @@ def check_server_consistency(
 
     if missing:
         return ValidationResult(
-            name=f"{target_name} server consistency",
+            name=name,
             passed=False,
             message="; ".join(parts),
             severity="error",
         )
 
-    msg = f"{len(actual_names)}/{len(expected_names)} expected servers present"
-    if extra:
-        msg += f" ({'; '.join(parts)})"
+    msg = f"{len(actual_names)}/{n_expected} expected servers present ({'; '.join(parts)})"
     return ValidationResult(
-        name=f"{target_name} server consistency",
+        name=name,
         passed=True,
         message=msg,
         severity="info",
@@ -67,14 +79,19 @@ def check_server_consistency(
 
 def check_no_excluded_sections(
     content: str,
-    exclude_set: set[str],
+    exclude_set: Set[str],
     label: str,
 ) -> ValidationResult:
-    """Verify *content* doesn't contain headers from *exclude_set*."""
+    """Verify *content* doesn't contain headers from *exclude_set*.
+
+    Only whole ``##``/``###`` header lines count, so excluding ``Setup``
+    does not flag ``## Setup Guide``.
+    """
     leaked: list[str] = []
-    for section_name in exclude_set:
-        if f"## {section_name}" in content or f"### {section_name}" in content:
-            leaked.append(section_name)
+    if exclude_set:
+        names = "|".join(re.escape(name) for name in exclude_set)
+        pattern = re.compile(rf"^#{{2,3}} [ \t]*({names})[ \t\r]*$", re.MULTILINE)
+        leaked = sorted({m.group(1) for m in pattern.finditer(content)})
 
     if leaked:
         return ValidationResult(
@@ -94,8 +111,14 @@ def check_no_excluded_sections(
 def check_case_insensitive_duplicates(
     server_names: set[str] | list[str],
     label: str,
+    *,
+    detailed: bool = True,
 ) -> ValidationResult:
-    """Check for case-insensitive duplicate server names."""
+    """Check for case-insensitive duplicate server names.
+
+    With ``detailed=False`` the scan stops at the first duplicate and only
+    that pair is reported.
+    """
     seen: dict[str, str] = {}
     duplicates: list[tuple[str, str]] = []
 
@@ -103,6 +126,8 @@ def check_case_insensitive_duplicates(
         lower = key.lower()
         if lower in seen:
             duplicates.append((seen[lower], key))
+            if not detailed:
+                break
         else:
             seen[lower] = key
 
@@ -127,7 +152,7 @@ def check_case_insensitive_duplicates(
 # ===================================================================
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ValidationReport:
     """Aggregate result of a validation run."""
 
@@ -153,8 +178,12 @@ class Validator:
         *,
         verbose: bool = False,
         target_filter: str | None = None,
+        fail_fast: bool = False,
     ) -> ValidationReport:
-        """Run all validation checks and return a :class:`ValidationReport`."""
+        """Run all validation checks and return a :class:`ValidationReport`.
+
+        With *fail_fast*, targets after the first one that fails are skipped.
+        """
         report = ValidationReport(passed=True)
 
         # Determine targets
@@ -172,15 +201,30 @@ class Validator:
                 return report
             target_names = [target_filter]
 
+        # Load source servers once and share them across all targets. On
+        # failure the targets get None and load (or fail to load) them
+        # themselves, so their other checks still run.
+        expected: dict[str, ServerConfig] | None = None
+        try:
+            expected = self._source.load_servers()
+        except Exception as exc:  # noqa: BLE001
+            report.passed = False
+            report.results.append(
+                ValidationResult(
+                    name="source servers",
+                    passed=False,
+                    message=str(exc),
+                )
+            )
+
         # Per-target adapter validation
         for name in target_names:
             target = self._targets[name]
             try:
-                vr_list = target.validate()
-                for vr in vr_list:
-                    report.results.append(vr)
-                    if not vr.passed and vr.severity == "error":
-                        report.passed = False
+                vr_list = target.validate(expected)
+                report.results.extend(vr_list)
+                if any(not vr.passed and vr.severity == "error" for vr in vr_list):
+                    report.passed = False
             except Exception as exc:  # noqa: BLE001
                 report.passed = False
                 report.results.append(
@@ -191,4 +235,7 @@ class Validator:
                     )
                 )
 
+            if fail_fast and not report.passed:
+                break
+
         return report
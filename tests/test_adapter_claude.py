@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+import pytest
+
 from agentsync.adapters.base import (
     Section,
     ServerConfig,
@@ -14,9 +17,10 @@ from agentsync.adapters.base import (
     ValidationResult,
     WriteResult,
 )
-from agentsync.adapters.claude import ClaudeSourceAdapter
+from agentsync.adapters.claude import ClaudeSourceAdapter, load_servers_cached
 from agentsync.config import AgentSyncConfig, SourceConfig, SyncOptions, TargetConfig
 from agentsync.sync import SyncEngine
+from agentsync.utils.markdown import parse_markdown_sections
 
 # ===================================================================
 # Helpers
@@ -59,7 +63,9 @@ class FakeTarget(TargetAdapter):
     def write(self, dry_run: bool = False) -> list[WriteResult]:
         return []
 
-    def validate(self) -> list[ValidationResult]:
+    def validate(
+        self, expected_servers: Mapping[str, ServerConfig] | None = None
+    ) -> list[ValidationResult]:
         return []
 
 
@@ -79,6 +85,10 @@ class TestReadJson:
         adapter = ClaudeSourceAdapter(_make_config(tmp_path))
         assert adapter._read_json(tmp_path / "nope.json") is None
 
+    def test_directory_returns_none(self, tmp_path: Path):
+        adapter = ClaudeSourceAdapter(_make_config(tmp_path))
+        assert adapter._read_json(tmp_path) is None
+
     def test_invalid_json_returns_none(self, tmp_path: Path):
         path = tmp_path / "bad.json"
         path.write_text("{not valid json!!!", encoding="utf-8")
@@ -92,28 +102,6 @@ class TestReadJson:
         assert adapter._read_json(path) is None
 
 
-# ===================================================================
-# _extract_servers
-# ===================================================================
-
-
-class TestExtractServers:
-    def test_normal_extraction(self, tmp_path: Path):
-        adapter = ClaudeSourceAdapter(_make_config(tmp_path))
-        raw = {
-            "server-a": {"command": "npx", "args": ["-y", "pkg"]},
-            "server-b": {"url": "https://example.com/mcp"},
-        }
-        result = adapter._extract_servers(raw)
-        assert set(result) == {"server-a", "server-b"}
-        assert result["server-a"].name == "server-a"
-        assert result["server-a"].config["command"] == "npx"
-
-    def test_empty_dict(self, tmp_path: Path):
-        adapter = ClaudeSourceAdapter(_make_config(tmp_path))
-        assert adapter._extract_servers({}) == {}
-
-
 # ===================================================================
 # load_servers
 # ===================================================================
@@ -269,6 +257,32 @@ class TestLoadServers:
         servers = adapter.load_servers()
         assert servers == {}
 
+    def test_non_dict_entries_skipped(self, tmp_path: Path):
+        """Individual server entries that aren't objects are dropped."""
+        _write_json(
+            tmp_path / ".mcp.json",
+            {"mcpServers": {"ok": {"command": "x"}, "bad": "string", "none": None}},
+        )
+        adapter = ClaudeSourceAdapter(_make_config(tmp_path))
+        servers = adapter.load_servers()
+        assert list(servers) == ["ok"]
+        assert servers["ok"].name == "ok"
+
+    def test_override_keeps_first_position(self, tmp_path: Path):
+        """An overridden server keeps the position of its first tier."""
+        _write_json(
+            tmp_path / ".claude.json",
+            {"mcpServers": {"a": {"command": "g"}, "b": {"command": "g"}}},
+        )
+        _write_json(
+            tmp_path / ".mcp.json",
+            {"mcpServers": {"c": {"command": "l"}, "a": {"command": "l"}}},
+        )
+        adapter = ClaudeSourceAdapter(_make_config(tmp_path))
+        servers = adapter.load_servers()
+        assert list(servers) == ["a", "b", "c"]
+        assert servers["a"].config == {"command": "l"}
+
 
 # ===================================================================
 # load_rules
@@ -304,6 +318,75 @@ class TestLoadRules:
         assert sections == []
 
 
+class TestRepeatedLoads:
+    def test_edited_server_config_not_seen_by_next_load(self, tmp_path: Path):
+        _write_json(tmp_path / ".mcp.json", {"mcpServers": {"a": {"command": "x"}}})
+        adapter = ClaudeSourceAdapter(_make_config(tmp_path))
+        adapter.load_servers()["a"].config["command"] = "MUTATED"
+        assert adapter.load_servers()["a"].config == {"command": "x"}
+
+    def test_rules_parsed_once_while_unchanged(self, tmp_path: Path, monkeypatch):
+        rules = tmp_path / "CLAUDE.md"
+        rules.write_text("## A\n\nBody\n", encoding="utf-8")
+        adapter = ClaudeSourceAdapter(_make_config(tmp_path))
+        calls: list[str] = []
+        monkeypatch.setattr(
+            "agentsync.adapters.claude.parse_markdown_sections",
+            lambda content: calls.append(content) or parse_markdown_sections(content),
+        )
+        first = adapter.load_rules()
+        first[0].header = "Changed"
+        first.clear()
+        assert [s.header for s in adapter.load_rules()] == ["A"]
+        assert len(calls) == 1
+
+        rules.write_text("## A\n\nBody\n\n## B\n", encoding="utf-8")
+        assert [s.header for s in adapter.load_rules()] == ["A", "B"]
+        assert len(calls) == 2
+
+
+# ===================================================================
+# load_servers_cached
+# ===================================================================
+
+
+class TestLoadServersCached:
+    def test_matches_adapter(self, tmp_path: Path):
+        _write_json(tmp_path / ".mcp.json", {"mcpServers": {"a": {"command": "x"}}})
+        cfg = _make_config(tmp_path)
+        assert load_servers_cached(cfg) == ClaudeSourceAdapter(cfg).load_servers()
+
+    def test_reuses_parse(self, tmp_path: Path, monkeypatch):
+        _write_json(tmp_path / ".mcp.json", {"mcpServers": {"a": {"command": "x"}}})
+        cfg = _make_config(tmp_path)
+        calls = []
+        original = ClaudeSourceAdapter.load_servers
+
+        def counting(self):
+            calls.append(1)
+            return original(self)
+
+        monkeypatch.setattr(ClaudeSourceAdapter, "load_servers", counting)
+        load_servers_cached(cfg)
+        load_servers_cached(cfg)
+        assert len(calls) == 1
+
+    def test_reloads_after_change(self, tmp_path: Path):
+        _write_json(tmp_path / ".mcp.json", {"mcpServers": {"a": {"command": "x"}}})
+        cfg = _make_config(tmp_path)
+        assert set(load_servers_cached(cfg)) == {"a"}
+
+        _write_json(tmp_path / ".mcp.json", {"mcpServers": {"a": {}, "bb": {"command": "y"}}})
+        assert set(load_servers_cached(cfg)) == {"a", "bb"}
+
+    def test_result_is_read_only(self, tmp_path: Path):
+        _write_json(tmp_path / ".mcp.json", {"mcpServers": {"a": {"command": "x"}}})
+        cfg = _make_config(tmp_path)
+        with pytest.raises(TypeError):
+            load_servers_cached(cfg)["b"] = ServerConfig(name="b", config={})
+        assert set(load_servers_cached(cfg)) == {"a"}
+
+
 # ===================================================================
 # Integration: ClaudeSourceAdapter + SyncEngine
 # ===================================================================
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Any
 
 from agentsync.adapters.base import Section, ServerConfig
 from agentsync.adapters.codex import (
@@ -93,6 +94,14 @@ class TestTomlValue:
         result = _toml_value({"key": "val"})
         assert result == '{key = "val"}'
 
+    def test_subclasses(self):
+        from collections import OrderedDict
+
+        assert _toml_value(OrderedDict(a=True)) == "{a = true}"
+
+    def test_unknown_type_falls_back_to_repr(self):
+        assert _toml_value(None) == "None"
+
 
 # ===================================================================
 # _server_to_toml
@@ -191,6 +200,17 @@ class TestWrite:
         assert "[mcp_servers.new_srv]" in content
         assert "[mcp_servers.old]" not in content
 
+    def test_replace_keeps_backslashes(self, tmp_path: Path):
+        (tmp_path / "config.toml").write_text(f"{MARKER_START}\n{MARKER_END}\n")
+
+        tc, cfg = _config(tmp_path)
+        adapter = CodexTargetAdapter(tc, cfg)
+        adapter.generate_mcp({"win": _sc("win", cwd="C:\\tools\\dir")})
+        adapter.write()
+
+        content = (tmp_path / "config.toml").read_text()
+        assert 'cwd = "C:\\\\tools\\\\dir"' in content
+
     def test_appends_markers(self, tmp_path: Path):
         # File without markers
         (tmp_path / "config.toml").write_text('[model]\nprovider = "openai"\n')
@@ -205,6 +225,42 @@ class TestWrite:
         assert MARKER_START in content
         assert "[mcp_servers.srv]" in content
 
+    def test_existing_config_read_once(self, tmp_path: Path, monkeypatch):
+        config = tmp_path / "config.toml"
+        config.write_text(f"[model]\n\n{MARKER_START}\n{MARKER_END}\n")
+        reads: list[Path] = []
+        real_read_bytes, real_read_text = Path.read_bytes, Path.read_text
+
+        def counting_read_bytes(self: Path) -> bytes:
+            reads.append(self)
+            return real_read_bytes(self)
+
+        def counting_read_text(self: Path, *args: Any, **kwargs: Any) -> str:
+            reads.append(self)
+            return real_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+        tc, cfg = _config(tmp_path)
+        adapter = CodexTargetAdapter(tc, cfg)
+        adapter.generate_mcp(_servers("a"))
+        adapter.write()
+
+        assert reads.count(config) == 1
+        assert "[mcp_servers.a]" in config.read_text()
+
+    def test_crlf_existing_normalized(self, tmp_path: Path):
+        config = tmp_path / "config.toml"
+        config.write_bytes(f"[model]\r\nx = 1\r\n\r\n{MARKER_START}\r\n{MARKER_END}\r\n".encode())
+        tc, cfg = _config(tmp_path)
+        adapter = CodexTargetAdapter(tc, cfg)
+        adapter.generate_mcp(_servers("a"))
+        adapter.write()
+
+        data = config.read_bytes()
+        assert b"\r" not in data
+        assert data.startswith(b"[model]\nx = 1\n\n" + MARKER_START.encode())
+
     def test_dry_run(self, tmp_path: Path):
         tc, cfg = _config(tmp_path)
         adapter = CodexTargetAdapter(tc, cfg)
@@ -268,3 +324,11 @@ class TestExtractServerNames:
 
     def test_empty(self):
         assert _extract_server_names("nothing here") == set()
+
+    def test_ignores_unterminated_header(self):
+        content = "[mcp_servers.broken\n[mcp_servers.ok]\nx = 1\n"
+        assert _extract_server_names(content) == {"ok"}
+
+    def test_ignores_other_tables(self):
+        content = "[model]\n[mcp_servers.a]\n[mcp_servers_extra]\n"
+        assert _extract_server_names(content) == {"a"}
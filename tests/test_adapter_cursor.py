@@ -184,6 +184,18 @@ class TestValidate:
         server_check = [r for r in results if "consistency" in r.name]
         assert any(not r.passed for r in server_check)
 
+    def test_uses_given_expected_servers(self, tmp_path: Path):
+        # The source lists "b" too, but the passed-in servers take precedence
+        (tmp_path / ".mcp.json").write_text(
+            json.dumps({"mcpServers": {"a": {"command": "x"}, "b": {"command": "y"}}})
+        )
+        (tmp_path / "mcp.json").write_text(json.dumps({"mcpServers": {"a": {}}}))
+        tc, cfg = _config(tmp_path)
+        adapter = CursorTargetAdapter(tc, cfg)
+        results = adapter.validate(_servers("a"))
+        server_check = [r for r in results if "consistency" in r.name]
+        assert server_check and all(r.passed for r in server_check)
+
     def test_excluded_section_leak(self, tmp_path: Path):
         (tmp_path / "rules.mdc").write_text("## Secret\n\nDon't show this.\n")
         tc, cfg = _config(tmp_path, exclude_sections=["Secret"])
@@ -192,6 +204,12 @@ class TestValidate:
         section_check = [r for r in results if "excluded" in r.name]
         assert any(not r.passed for r in section_check)
 
+    def test_paths_resolved_once(self, tmp_path: Path):
+        tc, cfg = _config(tmp_path)
+        adapter = CursorTargetAdapter(tc, cfg)
+        assert adapter._mcp_path == tmp_path / "mcp.json"
+        assert adapter._mcp_path is adapter._mcp_path
+
     def test_no_files(self, tmp_path: Path):
         tc, cfg = _config(tmp_path)
         adapter = CursorTargetAdapter(tc, cfg)
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -20,6 +23,7 @@ from agentsync.adapters.base import (
 )
 from agentsync.cli import EXIT_CONFIG_ERROR, EXIT_OK, EXIT_RUNTIME_ERROR, main
 from agentsync.config import CONFIG_FILENAME
+from agentsync.validate import ValidationReport
 
 # ===================================================================
 # Fake adapters for CLI tests
@@ -59,7 +63,9 @@ class FakeTarget(TargetAdapter):
             WriteResult(path="fake.json", written=True, bytes_written=100),
         ]
 
-    def validate(self) -> list[ValidationResult]:
+    def validate(
+        self, expected_servers: Mapping[str, ServerConfig] | None = None
+    ) -> list[ValidationResult]:
         return self.validation_results or [
             ValidationResult(name="fake check", passed=True, message="ok"),
         ]
@@ -84,12 +90,13 @@ def _write_config(tmp_path: Path, content: str = MINIMAL_CONFIG) -> Path:
 
 
 def _patch_adapters(source=None, targets=None):
-    """Return a pair of patch context managers for create_source and create_targets."""
+    """Patch create_source and create_targets together in one context manager."""
     src = source or FakeSource()
     tgts = targets or {"cursor": FakeTarget(name="cursor")}
-    return (
-        patch("agentsync.cli.create_source", return_value=src),
-        patch("agentsync.cli.create_targets", return_value=tgts),
+    return patch.multiple(
+        "agentsync.cli",
+        create_source=lambda cfg: src,
+        create_targets=lambda cfg: tgts,
     )
 
 
@@ -106,6 +113,18 @@ def test_version():
     assert "0.1.0" in result.output
 
 
+def test_cli_import_is_lightweight():
+    """Importing the CLI must not pull in adapters, config or YAML parsing."""
+    code = (
+        "import sys, agentsync.cli; "
+        "heavy = [m for m in ('agentsync.config', 'agentsync.adapters.codex', 'yaml', 'rich') "
+        "if m in sys.modules]; "
+        "print(','.join(heavy))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == ""
+
+
 def test_help():
     runner = CliRunner()
     result = runner.invoke(main, ["--help"])
@@ -174,8 +193,7 @@ def test_sync_no_config(tmp_path: Path):
 def test_sync_dry_run(tmp_path: Path):
     runner = CliRunner()
     cfg_path = _write_config(tmp_path)
-    p_src, p_tgt = _patch_adapters()
-    with p_src, p_tgt:
+    with _patch_adapters():
         result = runner.invoke(main, ["-c", str(cfg_path), "sync", "--dry-run"])
     assert result.exit_code == EXIT_OK
     assert "DRY RUN" in result.output
@@ -188,8 +206,7 @@ def test_sync_full(tmp_path: Path):
         name="cursor",
         write_results=[WriteResult(path="mcp.json", written=True, bytes_written=200)],
     )
-    p_src, p_tgt = _patch_adapters(targets={"cursor": target})
-    with p_src, p_tgt:
+    with _patch_adapters(targets={"cursor": target}):
         result = runner.invoke(main, ["-c", str(cfg_path), "sync"])
     assert result.exit_code == EXIT_OK
     assert "Sync complete" in result.output
@@ -198,8 +215,7 @@ def test_sync_full(tmp_path: Path):
 def test_sync_mcp_only(tmp_path: Path):
     runner = CliRunner()
     cfg_path = _write_config(tmp_path)
-    p_src, p_tgt = _patch_adapters()
-    with p_src, p_tgt:
+    with _patch_adapters():
         result = runner.invoke(main, ["-c", str(cfg_path), "sync", "--mcp-only"])
     assert result.exit_code == EXIT_OK
 
@@ -207,8 +223,7 @@ def test_sync_mcp_only(tmp_path: Path):
 def test_sync_target_filter(tmp_path: Path):
     runner = CliRunner()
     cfg_path = _write_config(tmp_path)
-    p_src, p_tgt = _patch_adapters()
-    with p_src, p_tgt:
+    with _patch_adapters():
         result = runner.invoke(main, ["-c", str(cfg_path), "sync", "-t", "cursor"])
     assert result.exit_code == EXIT_OK
 
@@ -225,8 +240,7 @@ def test_sync_no_backup_flag(tmp_path: Path):
         self._source = source
         self._targets = targets
 
-    p_src, p_tgt = _patch_adapters()
-    with p_src, p_tgt, patch("agentsync.sync.SyncEngine.__init__", patched_engine_init):
+    with _patch_adapters(), patch("agentsync.sync.SyncEngine.__init__", patched_engine_init):
         runner.invoke(main, ["-c", str(cfg_path), "sync", "--no-backup"])
 
     assert captured_cfg.get("backup") is False
@@ -253,8 +267,7 @@ def test_validate_pass(tmp_path: Path):
             ValidationResult(name="check1", passed=True, message="all good"),
         ],
     )
-    p_src, p_tgt = _patch_adapters(targets={"cursor": target})
-    with p_src, p_tgt:
+    with _patch_adapters(targets={"cursor": target}):
         result = runner.invoke(main, ["-c", str(cfg_path), "validate", "-v"])
     assert result.exit_code == EXIT_OK
     assert "passed" in result.output
@@ -269,13 +282,24 @@ def test_validate_fail(tmp_path: Path):
             ValidationResult(name="check1", passed=False, message="mismatch", severity="error"),
         ],
     )
-    p_src, p_tgt = _patch_adapters(targets={"cursor": target})
-    with p_src, p_tgt:
+    with _patch_adapters(targets={"cursor": target}):
         result = runner.invoke(main, ["-c", str(cfg_path), "validate"])
     assert result.exit_code == EXIT_RUNTIME_ERROR
     assert "failed" in result.output
 
 
+def test_validate_fail_fast(tmp_path: Path):
+    runner = CliRunner()
+    cfg_path = _write_config(tmp_path)
+    target = FakeTarget(name="cursor")
+    patch_run = patch("agentsync.validate.Validator.run")
+    with _patch_adapters(targets={"cursor": target}), patch_run as run:
+        run.return_value = ValidationReport(passed=True)
+        result = runner.invoke(main, ["-c", str(cfg_path), "validate", "--fail-fast"])
+    assert result.exit_code == EXIT_OK
+    assert run.call_args.kwargs["fail_fast"] is True
+
+
 # ===================================================================
 # Tests — status
 # ===================================================================
@@ -284,8 +308,7 @@ def test_validate_fail(tmp_path: Path):
 def test_status(tmp_path: Path):
     runner = CliRunner()
     cfg_path = _write_config(tmp_path)
-    p_src, p_tgt = _patch_adapters()
-    with p_src, p_tgt:
+    with _patch_adapters():
         result = runner.invoke(main, ["-c", str(cfg_path), "status"])
     assert result.exit_code == EXIT_OK
     assert "Source" in result.output
@@ -307,8 +330,7 @@ def test_status_no_config(tmp_path: Path):
 def test_quiet_sync(tmp_path: Path):
     runner = CliRunner()
     cfg_path = _write_config(tmp_path)
-    p_src, p_tgt = _patch_adapters()
-    with p_src, p_tgt:
+    with _patch_adapters():
         result = runner.invoke(main, ["-q", "-c", str(cfg_path), "sync"])
     assert result.exit_code == EXIT_OK
     # quiet mode should suppress the summary
@@ -318,8 +340,44 @@ def test_quiet_sync(tmp_path: Path):
 def test_quiet_validate(tmp_path: Path):
     runner = CliRunner()
     cfg_path = _write_config(tmp_path)
-    p_src, p_tgt = _patch_adapters()
-    with p_src, p_tgt:
+    with _patch_adapters():
         result = runner.invoke(main, ["-q", "-c", str(cfg_path), "validate"])
     assert result.exit_code == EXIT_OK
     assert "Validation" not in result.output
+
+
+# ===================================================================
+# Tests — adapter registry
+# ===================================================================
+
+
+def test_create_targets_by_type():
+    from agentsync.adapters.codex import CodexTargetAdapter
+    from agentsync.adapters.cursor import CursorTargetAdapter
+    from agentsync.cli import create_targets
+    from agentsync.config import AgentSyncConfig, TargetConfig
+
+    cfg = AgentSyncConfig(
+        targets={"c": TargetConfig(type="cursor"), "x": TargetConfig(type="codex")},
+    )
+    targets = create_targets(cfg)
+    assert isinstance(targets["c"], CursorTargetAdapter)
+    assert isinstance(targets["x"], CodexTargetAdapter)
+
+
+def test_create_targets_unknown_type():
+    from agentsync.cli import AdapterError, create_targets
+    from agentsync.config import AgentSyncConfig, TargetConfig
+
+    cfg = AgentSyncConfig(targets={"t": TargetConfig(type="nope")})
+    with pytest.raises(AdapterError, match="target type 'nope'"):
+        create_targets(cfg)
+
+
+def test_create_source_unknown_type():
+    from agentsync.cli import AdapterError, create_source
+    from agentsync.config import AgentSyncConfig, SourceConfig
+
+    cfg = AgentSyncConfig(source=SourceConfig(type="nope"))
+    with pytest.raises(AdapterError, match="source type 'nope'"):
+        create_source(cfg)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
@@ -9,6 +10,9 @@ import pytest
 from agentsync.config import (
     AgentSyncConfig,
     ConfigError,
+    RulesConfig,
+    SyncOptions,
+    TargetConfig,
     find_config,
     generate_default_config,
     load_config,
@@ -33,6 +37,11 @@ def test_resolve_absolute():
     assert result == Path("/absolute/path")
 
 
+def test_resolve_normalizes_like_path():
+    result = resolve_path("./foo//bar", Path("/base"))
+    assert result == Path("/base/foo/bar")
+
+
 # === find_config ===
 
 
@@ -50,6 +59,31 @@ def test_find_config_in_parent(tmp_path: Path):
     assert find_config(child) == config
 
 
+def test_find_config_notices_deleted_config(tmp_path: Path):
+    parent_config = tmp_path / "agentsync.yaml"
+    parent_config.write_text("version: 1")
+    child = tmp_path / "sub"
+    child.mkdir()
+    child_config = child / "agentsync.yaml"
+    child_config.write_text("version: 1")
+
+    assert find_config(child) == child_config
+    child_config.unlink()
+    assert find_config(child) == parent_config
+
+
+def test_find_config_notices_nearer_config(tmp_path: Path):
+    parent_config = tmp_path / "agentsync.yaml"
+    parent_config.write_text("version: 1")
+    child = tmp_path / "sub"
+    child.mkdir()
+
+    assert find_config(child) == parent_config
+    child_config = child / "agentsync.yaml"
+    child_config.write_text("version: 1")
+    assert find_config(child) == child_config
+
+
 def test_find_config_not_found(tmp_path: Path):
     # Create a deep nested path where no agentsync.yaml exists
     # find_config walks up, so it may find one in real parent dirs
@@ -157,6 +191,21 @@ def test_load_invalid_yaml(tmp_path: Path):
         load_config(config_file)
 
 
+def test_load_non_utf8_is_config_error(tmp_path: Path):
+    config_file = tmp_path / "agentsync.yaml"
+    config_file.write_bytes(MINIMAL_CONFIG.encode() + b"rules:\n  exclude_sections: [\xff]\n")
+    with pytest.raises(ConfigError, match="Invalid YAML"):
+        load_config(config_file)
+
+
+def test_load_utf8_values(tmp_path: Path):
+    config_file = tmp_path / "agentsync.yaml"
+    config_file.write_bytes(
+        (MINIMAL_CONFIG + "rules:\n  exclude_sections:\n    - Café\n").encode("utf-8")
+    )
+    assert load_config(config_file).rules.exclude_sections == ["Café"]
+
+
 def test_load_missing_version(tmp_path: Path):
     config_file = tmp_path / "agentsync.yaml"
     config_file.write_text("targets:\n  x:\n    type: cursor\n")
@@ -223,6 +272,19 @@ def test_load_non_bool_backup(tmp_path: Path):
         load_config(config_file)
 
 
+def test_load_fsync_option(tmp_path: Path):
+    config_file = tmp_path / "agentsync.yaml"
+    config_file.write_text("version: 1\ntargets:\n  x:\n    type: cursor\nsync:\n  fsync: true\n")
+    assert load_config(config_file).sync.fsync is True
+
+
+def test_load_non_bool_fsync(tmp_path: Path):
+    config_file = tmp_path / "agentsync.yaml"
+    config_file.write_text("version: 1\ntargets:\n  x:\n    type: cursor\nsync:\n  fsync: 1\n")
+    with pytest.raises(ConfigError, match="sync.fsync must be a boolean"):
+        load_config(config_file)
+
+
 def test_load_non_string_exclude_servers(tmp_path: Path):
     config_file = tmp_path / "agentsync.yaml"
     config_file.write_text(
@@ -241,6 +303,121 @@ def test_load_non_string_protocols(tmp_path: Path):
         load_config(config_file)
 
 
+@pytest.mark.parametrize("value", ["[{a: 1}]", "[123]", "Private"])
+def test_load_invalid_exclude_sections(tmp_path: Path, value: str):
+    config_file = tmp_path / "agentsync.yaml"
+    config_file.write_text(MINIMAL_CONFIG + f"rules:\n  exclude_sections: {value}\n")
+    with pytest.raises(ConfigError, match="exclude_sections must be a list of strings"):
+        load_config(config_file)
+
+
+def test_load_directory_is_not_found(tmp_path: Path):
+    with pytest.raises(ConfigError, match="not found"):
+        load_config(tmp_path)
+
+
+def test_load_cached_returns_independent_copies(tmp_path: Path, monkeypatch):
+    import yaml
+
+    calls = 0
+    real_load = yaml.load
+
+    def counting_load(stream, Loader):  # noqa: N803
+        nonlocal calls
+        calls += 1
+        return real_load(stream, Loader=Loader)
+
+    monkeypatch.setattr(yaml, "load", counting_load)
+    config_file = tmp_path / "agentsync.yaml"
+    config_file.write_text(FULL_CONFIG)
+
+    first = load_config(config_file)
+    first.sync = SyncOptions(backup=False)
+    first.targets["codex"].exclude_servers.append("other")
+    second = load_config(config_file)
+
+    assert calls == 1
+    assert second.sync.backup is True
+    assert second.targets["codex"].exclude_servers == ["codex"]
+
+
+def test_load_relative_path_keyed_on_cwd(tmp_path: Path, monkeypatch):
+    dir_a = tmp_path / "a"
+    dir_b = tmp_path / "b"
+    for d, name in ((dir_a, "alpha"), (dir_b, "bravo")):
+        d.mkdir()
+        (d / "agentsync.yaml").write_text(MINIMAL_CONFIG.replace("cursor:", f"{name}:", 1))
+    os.utime(dir_b / "agentsync.yaml", ns=(0, (dir_a / "agentsync.yaml").stat().st_mtime_ns))
+
+    monkeypatch.chdir(dir_a)
+    first = load_config(Path("agentsync.yaml"))
+    monkeypatch.chdir(dir_b)
+    second = load_config(Path("agentsync.yaml"))
+
+    assert list(first.targets) == ["alpha"]
+    assert list(second.targets) == ["bravo"]
+    assert second.config_dir == dir_b.resolve()
+
+
+def test_load_reparses_after_change(tmp_path: Path):
+    config_file = tmp_path / "agentsync.yaml"
+    config_file.write_text(MINIMAL_CONFIG)
+    assert list(load_config(config_file).targets) == ["cursor"]
+
+    config_file.write_text(FULL_CONFIG)
+    assert len(load_config(config_file).targets) == 3
+
+
+def test_load_non_string_path(tmp_path: Path):
+    config_file = tmp_path / "agentsync.yaml"
+    config_file.write_text("version: 1\ntargets:\n  x:\n    type: cursor\n    mcp_path: 42\n")
+    with pytest.raises(ConfigError, match="mcp_path must be a string"):
+        load_config(config_file)
+
+
+def test_load_empty_path_is_blank(tmp_path: Path):
+    config_file = tmp_path / "agentsync.yaml"
+    config_file.write_text("version: 1\ntargets:\n  x:\n    type: cursor\n    rules_path:\n")
+    assert load_config(config_file).targets["x"].rules_path == ""
+
+
+def test_load_target_lists_not_shared(tmp_path: Path):
+    config_file = tmp_path / "agentsync.yaml"
+    config_file.write_text("version: 1\ntargets:\n  a:\n    type: cursor\n  b:\n    type: codex\n")
+    targets = load_config(config_file).targets
+    targets["a"].exclude_servers.append("x")
+    assert targets["b"].exclude_servers == []
+
+
+def test_target_config_lowercased_sets():
+    tc = TargetConfig(type="cursor", exclude_servers=["GitHub"], protocols=["STDIO"])
+    assert tc.exclude_set == frozenset({"github"})
+    assert tc.protocol_set == frozenset({"stdio"})
+    assert tc == TargetConfig(type="cursor", exclude_servers=["GitHub"], protocols=["STDIO"])
+
+
+def test_target_config_sets_follow_list_changes():
+    tc = TargetConfig(type="cursor", exclude_servers=["GitHub"], protocols=["STDIO"])
+    assert tc.exclude_set == frozenset({"github"})
+    tc.exclude_servers.append("Slack")
+    tc.protocols = ["HTTP"]
+    assert tc.exclude_set == frozenset({"github", "slack"})
+    assert tc.protocol_set == frozenset({"http"})
+
+
+def test_rules_config_exclude_set():
+    rc = RulesConfig(exclude_sections=["Private", "Private"])
+    assert rc.exclude_set == frozenset({"Private"})
+    assert rc == RulesConfig(exclude_sections=["Private", "Private"])
+
+
+def test_rules_config_exclude_set_follows_list_changes():
+    rc = RulesConfig(exclude_sections=["A"])
+    assert rc.exclude_set == frozenset({"A"})
+    rc.exclude_sections.append("B")
+    assert rc.exclude_set == frozenset({"A", "B"})
+
+
 # === generate_default_config ===
 
 
@@ -45,6 +45,21 @@ def test_logger_flush_to_file(tmp_path: Path):
     assert "error message" in content
 
 
+def test_logger_flush_twice_does_not_duplicate(tmp_path: Path):
+    log = SyncLogger(quiet=True)
+    log_dir = tmp_path / "logs"
+    log.info("first")
+    log.flush_to_file(log_dir)
+    log.info("second")
+    log.flush_to_file(log_dir)
+
+    (log_file,) = log_dir.glob("sync-*.log")
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert lines[0].endswith("first")
+    assert lines[1].endswith("second")
+
+
 def test_logger_flush_empty_buffer(tmp_path: Path):
     """Flushing with no messages should not create a file."""
     log = SyncLogger(quiet=True)
@@ -65,6 +80,22 @@ def test_logger_dry_run_prefix():
     assert any("[DRY-RUN]" in line for line in log._buffer)
 
 
+def test_logger_quiet_never_creates_console():
+    log = SyncLogger(quiet=True)
+    log.section("S")
+    log.info("msg")
+    assert log._console is None
+
+
+def test_logger_prints_when_not_quiet(capsys):
+    log = SyncLogger()
+    log.section("Title")
+    log.info("hello")
+    out = capsys.readouterr().out
+    assert "Title" in out
+    assert "hello" in out
+
+
 # ===================================================================
 # IO — write_json with backup
 # ===================================================================
@@ -172,6 +203,32 @@ def test_sync_summary_single_file():
     print_sync_summary(result, console=console)
 
 
+def test_sync_summary_text():
+    console = Console(record=True, width=80)
+    result = SyncResult(
+        success=False,
+        dry_run=True,
+        target_results={
+            "cursor": TargetSyncResult(
+                target_name="cursor",
+                success=True,
+                writes=[
+                    WriteResult(path="a.json", written=True),
+                    WriteResult(path="b.mdc", written=True),
+                ],
+            ),
+            "codex": TargetSyncResult(target_name="codex", success=False, errors=["boom"]),
+        },
+    )
+    print_sync_summary(result, console=console)
+    assert console.export_text() == (
+        "\nSync complete: 2 targets, 2 files written, 1 error\n"
+        "  cursor           \u2713  2 files\n"
+        "  codex            \u2717  boom\n"
+        "\nDRY RUN \u2014 no files were written\n"
+    )
+
+
 # ===================================================================
 # Output — validation report edge cases
 # ===================================================================
@@ -203,6 +260,21 @@ def test_validation_report_failures_only():
     print_validation_report(report, verbose=False, console=console)
 
 
+def test_validation_report_counts_and_lines():
+    console = Console(record=True, width=80)
+    report = ValidationReport(
+        passed=False,
+        results=[
+            ValidationResult(name="check1", passed=True, message="ok"),
+            ValidationResult(name="check2", passed=False, message="bad"),
+            ValidationResult(name="check3", passed=True, message="fine"),
+        ],
+    )
+    print_validation_report(report, verbose=False, console=console)
+    text = console.export_text()
+    assert text == "\n  \u2717 check2: bad\n\nValidation: 2 passed, 1 failed\n"
+
+
 # ===================================================================
 # Output — status with missing source files
 # ===================================================================
@@ -269,6 +341,34 @@ def test_status_existing_source_files(tmp_path: Path):
     print_status(cfg, source, {"t1": target}, console=console)
 
 
+def test_status_checks_each_source_file_once(tmp_path: Path, monkeypatch):
+    """The project MCP file should not be stat'ed again when printing it."""
+    from unittest.mock import MagicMock
+
+    mcp_json = tmp_path / ".mcp.json"
+    mcp_json.write_text('{"mcpServers": {"s1": {}}}')
+    cfg = AgentSyncConfig(targets={"t1": TargetConfig(type="cursor")}, config_dir=tmp_path)
+
+    source = MagicMock()
+    source.load_servers.return_value = {"s1": ServerConfig(name="s1", config={})}
+    target = MagicMock()
+    target.validate.return_value = []
+
+    checked: list[Path] = []
+    original = Path.is_file
+
+    def counting(self: Path) -> bool:
+        checked.append(self)
+        return original(self)
+
+    monkeypatch.setattr(Path, "is_file", counting)
+    console = Console(record=True, width=200)
+    print_status(cfg, source, {"t1": target}, console=console)
+
+    assert checked.count(mcp_json) == 1
+    assert "(exists (1 servers))" in console.export_text()
+
+
 def test_status_target_validate_exception(tmp_path: Path):
     """Status should handle target.validate() throwing an exception."""
     from unittest.mock import MagicMock
@@ -291,6 +391,31 @@ def test_status_target_validate_exception(tmp_path: Path):
     print_status(cfg, source, {"t1": target}, console=console)
 
 
+def test_status_long_error_not_truncated(tmp_path: Path):
+    """Long unbroken error details wrap instead of being cut off."""
+    from unittest.mock import MagicMock
+
+    console = Console(record=True, width=60)
+    cfg = AgentSyncConfig(
+        source=SourceConfig(
+            global_config=str(tmp_path / "x.json"),
+            project_mcp=str(tmp_path / "y.json"),
+            rules_file=str(tmp_path / "z.md"),
+        ),
+        targets={"t1": TargetConfig(type="cursor")},
+        config_dir=tmp_path,
+    )
+
+    long_path = "/very/" + "deep/" * 20 + "config.json"
+    target = MagicMock()
+    target.validate.side_effect = RuntimeError(long_path)
+
+    print_status(cfg, MagicMock(), {"t1": target}, console=console)
+    text = console.export_text()
+    assert "\u2026" not in text
+    assert "config.json" in text
+
+
 def test_status_target_with_failures(tmp_path: Path):
     """Status should show failure count when validation fails."""
     from unittest.mock import MagicMock
@@ -123,6 +123,32 @@ def test_full_sync_pipeline(tmp_path: Path):
     assert "browsermcp" not in ag_servers
 
 
+def test_targets_sharing_rules_path(tmp_path: Path):
+    """Two targets writing the same rules file must not race each other."""
+    cfg = _setup_project(tmp_path)
+    shared = str(tmp_path / "output" / "AGENTS.md")
+    cfg.targets = {
+        "codex": TargetConfig(
+            type="codex",
+            config_path=str(tmp_path / "output" / "codex_a.toml"),
+            rules_path=shared,
+        ),
+        "codex2": TargetConfig(
+            type="codex",
+            config_path=str(tmp_path / "output" / "codex_b.toml"),
+            rules_path=shared,
+        ),
+    }
+
+    for _ in range(5):
+        result = SyncEngine(cfg, create_source(cfg), create_targets(cfg)).run()
+        assert result.success is True
+        assert all(not tr.errors for tr in result.target_results.values())
+
+    assert "Behaviour Rules" in (tmp_path / "output" / "AGENTS.md").read_text()
+    assert [p.name for p in (tmp_path / "output").iterdir() if p.name.startswith(".")] == []
+
+
 def test_dry_run_no_files(tmp_path: Path):
     """Dry-run should NOT create any output files."""
     cfg = _setup_project(tmp_path)
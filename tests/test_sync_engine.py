@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -58,7 +60,9 @@ class FakeTarget(TargetAdapter):
             raise RuntimeError("write failed")
         return list(self.write_results)
 
-    def validate(self) -> list[ValidationResult]:
+    def validate(
+        self, expected_servers: Mapping[str, ServerConfig] | None = None
+    ) -> list[ValidationResult]:
         return []
 
 
@@ -173,6 +177,31 @@ def test_exclude_servers():
     assert "drop" not in t1.generated_mcp
 
 
+def test_exclude_servers_case_insensitive():
+    source = FakeSource(servers=_servers("Keep", "GitHub"))
+    t1 = FakeTarget()
+    cfg = _config(target_overrides={"t1": {"exclude_servers": ["GITHUB"]}})
+    engine = SyncEngine(cfg, source, {"t1": t1})
+
+    engine.run()
+
+    assert list(t1.generated_mcp) == ["keep"]
+
+
+def test_exclude_servers_changed_after_construction():
+    source = FakeSource(servers=_servers("keep", "drop"))
+    t1 = FakeTarget()
+    cfg = _config()
+    engine = SyncEngine(cfg, source, {"t1": t1})
+    engine.run()
+    assert set(t1.generated_mcp) == {"keep", "drop"}
+
+    cfg.targets["t1"].exclude_servers.append("DROP")
+    engine.run()
+
+    assert list(t1.generated_mcp) == ["keep"]
+
+
 def test_protocol_filter_stdio():
     srv = {
         "stdio_srv": ServerConfig(name="stdio_srv", config={"command": "x"}),
@@ -217,3 +246,140 @@ def test_target_write_error_captured():
     tr = result.target_results["t1"]
     assert not tr.success
     assert tr.errors
+
+
+def test_write_error_does_not_affect_other_targets():
+    source = FakeSource(servers=_servers("s1"))
+    ok = WriteResult(path="ok", written=True)
+    targets = {
+        "t1": FakeTarget(write_results=[ok]),
+        "t2": FakeTarget(raise_on_write=True),
+        "t3": FakeTarget(write_results=[ok]),
+    }
+    engine = SyncEngine(_config(["t1", "t2", "t3"]), source, dict(targets))
+
+    result = engine.run()
+
+    assert result.success is False
+    assert list(result.target_results) == ["t1", "t2", "t3"]
+    assert result.target_results["t1"].writes == [ok]
+    assert result.target_results["t2"].errors == ["write failed"]
+    assert result.target_results["t3"].writes == [ok]
+
+
+def test_fsync_flushes_written_files_once(monkeypatch):
+    flushed: list[list[str]] = []
+    monkeypatch.setattr("agentsync.sync.flush_to_disk", flushed.append)
+    targets = {
+        "t1": FakeTarget(write_results=[WriteResult(path="a", written=True)]),
+        "t2": FakeTarget(write_results=[WriteResult(path="b", written=False)]),
+        "t3": FakeTarget(write_results=[WriteResult(path="c", written=True)]),
+    }
+    cfg = _config(["t1", "t2", "t3"])
+    cfg.sync = SyncOptions(fsync=True)
+
+    SyncEngine(cfg, FakeSource(servers=_servers("s1")), targets).run()
+    assert flushed == [["a", "c"]]
+
+    SyncEngine(cfg, FakeSource(servers=_servers("s1")), targets).run(dry_run=True)
+    cfg.sync = SyncOptions()
+    SyncEngine(cfg, FakeSource(servers=_servers("s1")), targets).run()
+    assert len(flushed) == 1
+
+
+def test_fsync_error_reported_not_raised(tmp_path, monkeypatch):
+    def failing_fsync(fd: int) -> None:
+        raise OSError(5, "Input/output error")
+
+    monkeypatch.setattr(os, "fsync", failing_fsync)
+    monkeypatch.setattr("agentsync.utils.io._F_FULLFSYNC", None)
+    written = tmp_path / "out.json"
+    written.write_text("{}")
+    targets = {"t1": FakeTarget(write_results=[WriteResult(path=str(written), written=True)])}
+    cfg = _config()
+    cfg.sync = SyncOptions(fsync=True)
+
+    result = SyncEngine(cfg, FakeSource(servers=_servers("s1")), targets).run(quiet=True)
+
+    assert result.success is False
+    assert result.target_results["t1"].success is True
+
+
+def test_targets_written_concurrently():
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    @dataclass
+    class BarrierTarget(FakeTarget):
+        def write(self, dry_run: bool = False) -> list[WriteResult]:
+            # Deadlocks (and times out) unless both writes run at once
+            barrier.wait()
+            return []
+
+    source = FakeSource(servers=_servers("s1"))
+    engine = SyncEngine(
+        _config(["t1", "t2"]), source, {"t1": BarrierTarget(), "t2": BarrierTarget()}
+    )
+
+    result = engine.run()
+
+    assert result.success is True
+
+
+def test_targets_sharing_a_path_written_in_order(tmp_path):
+    import threading
+    import time
+
+    lock = threading.Lock()
+    order: list[str] = []
+    overlapped: list[str] = []
+
+    @dataclass
+    class SlowTarget(FakeTarget):
+        def write(self, dry_run: bool = False) -> list[WriteResult]:
+            if not lock.acquire(blocking=False):
+                overlapped.append(self.name)
+                return []
+            try:
+                time.sleep(0.05)
+                order.append(self.name)
+            finally:
+                lock.release()
+            return []
+
+    shared = {"rules_path": "out/AGENTS.md"}
+    cfg = _config(["t1", "t2"], target_overrides={"t1": shared, "t2": shared})
+    cfg.config_dir = tmp_path
+    targets = {"t1": SlowTarget(name="t1"), "t2": SlowTarget(name="t2")}
+
+    result = SyncEngine(cfg, FakeSource(servers=_servers("s1")), targets).run()
+
+    assert result.success is True
+    assert overlapped == []
+    assert order == ["t1", "t2"]
+
+
+def test_source_servers_and_rules_loaded_concurrently():
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    class BarrierSource(FakeSource):
+        def load_servers(self) -> dict[str, ServerConfig]:
+            barrier.wait()
+            return super().load_servers()
+
+        def load_rules(self) -> list[Section]:
+            barrier.wait()
+            return super().load_rules()
+
+    source = BarrierSource(servers=_servers("s1"), sections=_sections("A"))
+    t1 = FakeTarget()
+    engine = SyncEngine(_config(), source, {"t1": t1})
+
+    result = engine.run()
+
+    assert result.success is True
+    assert list(t1.generated_mcp) == ["s1"]
+    assert [s.header for s in t1.generated_rules] == ["A"]
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import errno
+import os
 from pathlib import Path
 
 from agentsync.utils.backup import backup_file
+from agentsync.utils.io import write_text
 from agentsync.utils.logger import SilentLogger
 
 
@@ -40,3 +43,53 @@ def test_backup_creates_dir(tmp_path: Path):
 
     assert result is not None
     assert backup_dir.exists()
+
+
+def test_backup_skipped_when_content_unchanged(tmp_path: Path):
+    source = tmp_path / "file.txt"
+    source.write_bytes(b"data")
+    backup_dir = tmp_path / "backups"
+
+    assert backup_file(source, backup_dir, _log(), new_content=b"data") is None
+    assert not backup_dir.exists()
+
+    assert backup_file(source, backup_dir, _log(), new_content=b"other") is not None
+
+
+def test_backup_survives_atomic_replace(tmp_path: Path):
+    source = tmp_path / "file.txt"
+    source.write_bytes(b"old")
+
+    result = write_text(source, "new", _log(), backup_dir=tmp_path / "backups")
+
+    assert result.written
+    (backup,) = (tmp_path / "backups").iterdir()
+    assert backup.read_bytes() == b"old"
+    assert source.read_bytes() == b"new"
+
+
+def test_backup_twice_in_a_row(tmp_path: Path):
+    source = tmp_path / "file.txt"
+    source.write_bytes(b"data")
+    backup_dir = tmp_path / "backups"
+
+    first = backup_file(source, backup_dir, _log())
+    second = backup_file(source, backup_dir, _log())
+
+    assert first is not None and second is not None
+    assert second.read_bytes() == b"data"
+
+
+def test_backup_falls_back_to_copy(tmp_path: Path, monkeypatch):
+    source = tmp_path / "file.txt"
+    source.write_bytes(b"data")
+
+    def no_links(src, dst):
+        raise OSError(errno.EXDEV, "cross-device link")
+
+    monkeypatch.setattr(os, "link", no_links)
+    result = backup_file(source, tmp_path / "backups", _log())
+
+    assert result is not None
+    assert result.read_bytes() == b"data"
+    assert result.stat().st_ino != source.stat().st_ino
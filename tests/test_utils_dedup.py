@@ -44,3 +44,19 @@ def test_keys_lowercased():
 def test_empty_input():
     result = dedup_servers({}, _log())
     assert result == {}
+
+
+def test_replacement_is_logged():
+    log = _log()
+    dedup_servers({"Notion": _sc("Notion"), "notion": _sc("notion")}, log)
+    assert any("'Notion' replaced by 'notion'" in line for line in log._buffer)
+
+
+def test_log_is_optional():
+    result = dedup_servers({"A": _sc("A"), "a": _sc("a")})
+    assert list(result) == ["a"]
+
+
+def test_order_preserved_with_duplicates():
+    servers = {"B": _sc("B"), "a": _sc("a"), "b": _sc("b")}
+    assert list(dedup_servers(servers, _log())) == ["b", "a"]
@@ -60,3 +60,11 @@ def test_added_and_removed(tmp_path: Path):
     show_server_diff("target", existing, _servers("new"), log)
     assert any("+1" in line for line in log._buffer)
     assert any("-1" in line for line in log._buffer)
+
+
+def test_non_object_json(tmp_path: Path):
+    existing = tmp_path / "mcp.json"
+    existing.write_text("[1, 2]")
+    log = SyncLogger(quiet=True)
+    show_server_diff("target", existing, _servers("a"), log)
+    assert any("+1 server" in line for line in log._buffer)
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import json
+import os
 from pathlib import Path
 
-from agentsync.utils.io import write_json, write_text
+import pytest
+
+from agentsync.utils.io import flush_to_disk, write_json, write_text
 from agentsync.utils.logger import SilentLogger
 
 
@@ -37,6 +41,14 @@ def test_write_text_no_change(tmp_path: Path):
     assert "no changes" in wr.message
 
 
+def test_write_text_dry_run_would_update(tmp_path: Path):
+    target = tmp_path / "out.txt"
+    target.write_text("old\n")
+    wr = write_text(target, "new\n", _log(), dry_run=True)
+    assert "WOULD UPDATE (4 bytes)" in wr.message
+    assert target.read_text() == "old\n"
+
+
 def test_write_text_with_backup(tmp_path: Path):
     target = tmp_path / "out.txt"
     target.write_text("old\n")
@@ -54,8 +66,6 @@ def test_write_json_creates_file(tmp_path: Path):
     target = tmp_path / "out.json"
     wr = write_json(target, {"key": "value"}, _log())
     assert wr.written is True
-    import json
-
     assert json.loads(target.read_text()) == {"key": "value"}
 
 
@@ -66,8 +76,152 @@ def test_write_json_dry_run(tmp_path: Path):
     assert not target.exists()
 
 
+def test_write_json_reports_encoded_size(tmp_path: Path):
+    target = tmp_path / "out.json"
+    wr = write_json(target, {"name": "café"}, _log())
+    assert target.read_bytes().endswith(b"\n")
+    assert wr.bytes_written == len(target.read_bytes())
+
+
+def test_write_json_unserializable_raises(tmp_path: Path):
+    target = tmp_path / "out.json"
+    with pytest.raises(TypeError):
+        write_json(target, {"bad": object()}, _log())
+    assert not target.exists()
+
+
 def test_write_text_creates_parent_dirs(tmp_path: Path):
     target = tmp_path / "deep" / "nested" / "file.txt"
     wr = write_text(target, "content\n", _log())
     assert wr.written is True
     assert target.read_text() == "content\n"
+
+
+# === unchanged / atomic replace ===
+
+
+def test_write_unchanged_skips_write_and_backup(tmp_path: Path):
+    target = tmp_path / "out.txt"
+    target.write_text("same\n")
+    backup_dir = tmp_path / "backups"
+    wr = write_text(target, "same\n", _log(), backup_dir=backup_dir)
+    assert wr.written is False
+    assert "no changes" in wr.message
+    assert not backup_dir.exists()
+
+
+def test_write_skips_reading_file_of_different_size(tmp_path: Path, monkeypatch):
+    target = tmp_path / "out.txt"
+    target.write_text("old\n")
+    backup_dir = tmp_path / "backups"
+
+    def no_reads(self):
+        raise AssertionError(f"unexpected read of {self}")
+
+    monkeypatch.setattr(Path, "read_bytes", no_reads)
+    wr = write_text(target, "longer\n", _log(), backup_dir=backup_dir)
+    monkeypatch.undo()
+
+    assert wr.written is True
+    assert target.read_text() == "longer\n"
+    assert [p.read_text() for p in backup_dir.iterdir()] == ["old\n"]
+
+
+def test_write_same_size_different_content(tmp_path: Path):
+    target = tmp_path / "out.txt"
+    target.write_text("abc\n")
+    wr = write_text(target, "xyz\n", _log(), dry_run=True)
+    assert "WOULD UPDATE" in wr.message
+    wr = write_text(target, "xyz\n", _log())
+    assert wr.written is True
+    assert target.read_text() == "xyz\n"
+
+
+def test_write_leaves_no_temp_file(tmp_path: Path):
+    target = tmp_path / "out.txt"
+    write_text(target, "one\n", _log())
+    write_text(target, "two\n", _log())
+    assert [p.name for p in tmp_path.iterdir()] == ["out.txt"]
+    assert target.read_text() == "two\n"
+
+
+def test_write_keeps_permissions(tmp_path: Path):
+    target = tmp_path / "out.txt"
+    target.write_text("old\n")
+    target.chmod(0o600)
+    write_text(target, "new\n", _log())
+    assert target.stat().st_mode & 0o777 == 0o600
+
+
+def test_write_creates_temp_with_existing_mode(tmp_path: Path, monkeypatch):
+    target = tmp_path / "secret.json"
+    target.write_text("{}\n")
+    target.chmod(0o600)
+    modes: list[int] = []
+    real_open = os.open
+
+    def recording_open(path, flags, mode=0o777, *args, **kwargs):
+        if str(path).endswith(".agentsync-tmp"):
+            modes.append(mode)
+        return real_open(path, flags, mode, *args, **kwargs)
+
+    monkeypatch.setattr(os, "open", recording_open)
+    write_json(target, {"token": "x"}, _log())
+
+    assert modes == [0o600]
+
+
+def test_concurrent_writers_to_same_path(tmp_path: Path):
+    import threading
+
+    target = tmp_path / "out.txt"
+    errors: list[BaseException] = []
+
+    def writer(n: int) -> None:
+        try:
+            for i in range(20):
+                write_text(target, f"{n}-{i}\n", _log())
+        except BaseException as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert [p.name for p in tmp_path.iterdir()] == ["out.txt"]
+
+
+def test_write_through_symlink(tmp_path: Path):
+    real = tmp_path / "real.json"
+    real.write_text("{}\n")
+    link = tmp_path / "link.json"
+    link.symlink_to(real)
+    write_json(link, {"a": 1}, _log())
+    assert link.is_symlink()
+    assert json.loads(real.read_text()) == {"a": 1}
+
+
+def test_flush_to_disk_fsyncs_files_and_parent_dirs(tmp_path: Path, monkeypatch):
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    a, b, c = tmp_path / "a", tmp_path / "b", sub / "c"
+    for p in (a, b, c):
+        p.write_text(p.name)
+    fsynced: list[int] = []
+    monkeypatch.setattr(os, "fsync", lambda fd: fsynced.append(os.fstat(fd).st_ino))
+    monkeypatch.setattr(os, "sync", lambda: pytest.fail("os.sync called"), raising=False)
+
+    flush_to_disk([str(a), str(b), str(c), str(a)])
+
+    expected = [a, b, c]
+    if os.name != "nt":
+        expected += [tmp_path, sub]
+    assert sorted(fsynced) == sorted(p.stat().st_ino for p in expected)
+
+
+def test_flush_to_disk_empty_is_noop(monkeypatch):
+    monkeypatch.setattr(os, "fsync", lambda fd: pytest.fail("fsync called"))
+    flush_to_disk([])
@@ -0,0 +1,104 @@
+"""Tests for agentsync.utils.json_fast — backend-agnostic JSON helpers."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from agentsync.utils import json_fast
+
+
+def test_loads_bytes():
+    assert json_fast.loads(b'{"mcpServers": {"a": {"command": "x"}}}') == {
+        "mcpServers": {"a": {"command": "x"}}
+    }
+
+
+def test_loads_str():
+    assert json_fast.loads('{"a": 1}') == {"a": 1}
+
+
+def test_loads_invalid_raises_decode_error():
+    with pytest.raises(json_fast.DecodeError):
+        json_fast.loads(b"{not json")
+
+
+def test_loads_invalid_utf8_raises_decode_error():
+    with pytest.raises(json_fast.DecodeError):
+        json_fast.loads(b'{"a": "\xff"}')
+
+
+# Inputs where orjson on its own would disagree with the stdlib json module.
+@pytest.mark.parametrize(
+    "data",
+    [
+        b'{"a": NaN, "b": -Infinity}',
+        b'{"a": 123456789012345678901234567890}',
+        b'{"a": -9223372036854775809}',
+        b'{"a": 18446744073709551615}',
+        b'{"a": 1e400}',
+        b'{"a": "\\ud800"}',
+        b'\xef\xbb\xbf{"a": 1}',
+        '{"a": NaN}',
+    ],
+)
+def test_loads_matches_stdlib(data: bytes | str):
+    assert repr(json_fast.loads(data)) == repr(json.loads(data))
+
+
+def test_dumps_returns_indented_bytes():
+    data = {"mcpServers": {"a": {"command": "x", "args": ["1", "2"]}}}
+    out = json_fast.dumps(data)
+    assert isinstance(out, bytes)
+    assert out.decode("utf-8") == json.dumps(data, indent=2)
+
+
+def test_dumps_keeps_non_ascii():
+    out = json_fast.dumps({"name": "café"})
+    assert "café".encode() in out
+
+
+class _Str(str):
+    pass
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"a": float("nan"), "b": float("inf")},
+        {"a": 1e100, "b": 1e-05, "c": 1.0, "d": 0.1},
+        {"a": 2**70, "b": -(2**63) - 1, "c": 2**64 - 1, "d": -(2**63)},
+        {2: "int key", True: "bool key", None: "none key"},
+        {"a": ("tuple",), _Str("b"): _Str("str subclass")},
+        {"a": [{"b": [True, False, None, "\x00\x7f\u2028"]}], "c": {}, "d": []},
+    ],
+)
+def test_dumps_matches_stdlib(data: object):
+    assert json_fast.dumps(data) == json.dumps(data, indent=2, ensure_ascii=False).encode()
+
+
+def test_dumps_rejects_what_stdlib_rejects():
+    with pytest.raises(TypeError):
+        json_fast.dumps({"a": {1, 2}})
+
+
+# === member_keys ===
+
+
+def test_member_keys():
+    data = b'{"mcpServers": {"a": {"env": {"K": "V"}}, "b": {}}, "other": 1}'
+    assert json_fast.member_keys(data, "mcpServers") == {"a", "b"}
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"{}", b'{"mcpServers": [1, 2]}', b"[1, 2]", b'"text"'],
+)
+def test_member_keys_missing_or_wrong_type(data: bytes):
+    assert json_fast.member_keys(data, "mcpServers") == set()
+
+
+def test_member_keys_invalid_raises_decode_error():
+    with pytest.raises(json_fast.DecodeError):
+        json_fast.member_keys(b"{not json", "mcpServers")
@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 from agentsync.adapters.base import Section
-from agentsync.utils.markdown import filter_sections, parse_markdown_sections
+from agentsync.utils.markdown import (
+    filter_sections,
+    iter_filter_sections,
+    parse_markdown_sections,
+)
 
 # === parse_markdown_sections ===
 
@@ -72,6 +76,24 @@ def test_parse_single_section():
     assert sections[0].level == 2
 
 
+def test_parse_content_spans_up_to_next_header():
+    md = "Intro\n## A\nbody a\n\n### B\nbody b\n"
+    sections = parse_markdown_sections(md)
+    assert [s.content for s in sections] == ["## A\nbody a\n", "### B\nbody b\n"]
+
+
+def test_parse_header_without_trailing_newline():
+    sections = parse_markdown_sections("Intro\n### Last  ")
+    assert sections == [Section(header="Last", level=3, content="### Last  ")]
+
+
+def test_parse_ignores_deeper_and_unspaced_headers():
+    md = "## Top\n#### Deep\n##NoSpace\n"
+    sections = parse_markdown_sections(md)
+    assert len(sections) == 1
+    assert sections[0].content == md
+
+
 def test_parse_hash_in_code_block_not_treated_as_header():
     """Lines starting with ## inside content (not at header position) stay in content."""
     md = "## Real\n\nSome text\nwith ## embedded hash\n"
@@ -124,3 +146,10 @@ def test_filter_all_excluded():
     all_headers = {s.header for s in sections}
     result = filter_sections(sections, all_headers)
     assert result == []
+
+
+def test_iter_filter_sections_is_lazy():
+    result = iter_filter_sections(iter(_make_sections()), {"Remove"})
+    assert not isinstance(result, list)
+    assert next(result).header == "Keep"
+    assert [s.header for s in result] == ["After", "Remove Leaf"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -45,6 +46,7 @@ class FakeSource(SourceAdapter):
 class FakeTarget(TargetAdapter):
     validation_results: list[ValidationResult] = field(default_factory=list)
     raise_on_validate: bool = False
+    received: list[Mapping[str, ServerConfig] | None] = field(default_factory=list)
 
     def generate_mcp(self, servers: dict[str, ServerConfig]) -> dict[str, Any]:
         return {}
@@ -55,7 +57,10 @@ class FakeTarget(TargetAdapter):
     def write(self, dry_run: bool = False) -> list[WriteResult]:
         return []
 
-    def validate(self) -> list[ValidationResult]:
+    def validate(
+        self, expected_servers: Mapping[str, ServerConfig] | None = None
+    ) -> list[ValidationResult]:
+        self.received.append(expected_servers)
         if self.raise_on_validate:
             raise RuntimeError("validation boom")
         return list(self.validation_results)
@@ -78,6 +83,16 @@ def test_check_server_consistency_all_present():
     assert vr.passed is True
 
 
+def test_check_server_consistency_messages():
+    expected = {"a": _sc("a"), "b": _sc("b")}
+    exact = check_server_consistency(expected, {"a", "b"}, "T", exclude=set())
+    extra = check_server_consistency(expected, {"a", "b", "z"}, "T", exclude=set())
+    assert exact.name == "T server consistency"
+    assert exact.message == "2/2 expected servers present"
+    assert extra.passed is True
+    assert extra.message == "3/2 expected servers present (extra 1: z)"
+
+
 def test_check_server_consistency_missing():
     expected = {"a": _sc("a"), "b": _sc("b"), "c": _sc("c")}
     vr = check_server_consistency(expected, {"a"}, "T", exclude=set())
@@ -91,6 +106,33 @@ def test_check_server_consistency_with_exclude():
     assert vr.passed is True
 
 
+def test_check_server_consistency_exclude_case_insensitive():
+    expected = {"a": _sc("a"), "Excluded": _sc("Excluded"), "other": _sc("other")}
+    vr = check_server_consistency(expected, {"a", "other"}, "T", exclude={"EXCLUDED", "OTHER"})
+    assert vr.passed is True
+    assert "extra 1: other" in vr.message
+
+
+def test_check_server_consistency_no_exclude_skips_lowercasing():
+    class Name(str):
+        def lower(self) -> str:
+            raise AssertionError("lower() called without excludes")
+
+    expected = {Name("A"): _sc("A")}
+    vr = check_server_consistency(expected, {"A"}, "T", exclude=set())
+    assert vr.passed is True
+
+
+def test_check_server_consistency_excludes_by_key():
+    # Keys, not ServerConfig.name, decide exclusion (they differ after dedup).
+    expected = {"notion": ServerConfig(name="Notion", config={}), "a": _sc("a")}
+    vr = check_server_consistency(expected, {"a"}, "T", exclude={"NOTION"})
+    assert vr.passed is True
+    expected = {"notion": ServerConfig(name="other", config={}), "a": _sc("a")}
+    vr = check_server_consistency(expected, {"a"}, "T", exclude={"other"})
+    assert vr.passed is False
+
+
 def test_check_server_consistency_stdio_only():
     expected = {
         "stdio": ServerConfig(name="stdio", config={"command": "x"}),
@@ -113,6 +155,24 @@ def test_check_no_excluded_sections_leaked():
     assert "Dangerous" in vr.message
 
 
+def test_check_no_excluded_sections_matches_whole_header():
+    content = "## Setup Guide\nsee ## Setup for details\n"
+    vr = check_no_excluded_sections(content, {"Setup"}, "test")
+    assert vr.passed is True
+
+
+def test_check_no_excluded_sections_escapes_and_sorts():
+    content = "### C++ (legacy)\n## Beta\n## Alpha  \n## a.b\n"
+    vr = check_no_excluded_sections(content, {"Beta", "Alpha", "C++ (legacy)", "a*b"}, "test")
+    assert vr.passed is False
+    assert vr.message == "contains 3 excluded sections: Alpha, Beta, C++ (legacy)"
+
+
+def test_check_no_excluded_sections_empty_exclude():
+    vr = check_no_excluded_sections("## Anything\n", set(), "test")
+    assert vr.passed is True
+
+
 def test_check_case_insensitive_duplicates_clean():
     vr = check_case_insensitive_duplicates(["alpha", "beta"], "test")
     assert vr.passed is True
@@ -123,6 +183,15 @@ def test_check_case_insensitive_duplicates_found():
     assert vr.passed is False
 
 
+def test_check_case_insensitive_duplicates_not_detailed_stops_early():
+    names = ["a", "A", "b", "B"]
+    full = check_case_insensitive_duplicates(names, "test")
+    first = check_case_insensitive_duplicates(names, "test", detailed=False)
+    assert full.message == "duplicates found: 'a' vs 'A', 'b' vs 'B'"
+    assert first.passed is False
+    assert first.message == "duplicates found: 'a' vs 'A'"
+
+
 # ===================================================================
 # Validator
 # ===================================================================
@@ -173,6 +242,32 @@ def test_validator_target_filter():
     assert len(report.results) == 1
 
 
+def test_validator_fail_fast():
+    source = FakeSource(servers={"a": _sc("a")})
+    bad = ValidationResult(name="check", passed=False, message="bad", severity="error")
+    t1, t2, t3 = FakeTarget(), FakeTarget(validation_results=[bad]), FakeTarget()
+    cfg = _config(target_names=["t1", "t2", "t3"])
+    targets = {"t1": t1, "t2": t2, "t3": t3}
+
+    report = Validator(cfg, source, targets).run(fail_fast=True)
+    assert report.passed is False
+    assert report.results == [bad]
+    assert len(t3.received) == 0
+
+    Validator(cfg, source, targets).run()
+    assert len(t3.received) == 1
+
+
+def test_validator_fail_fast_ignores_warnings():
+    source = FakeSource(servers={"a": _sc("a")})
+    warn = ValidationResult(name="check", passed=False, message="meh", severity="warning")
+    t1, t2 = FakeTarget(validation_results=[warn]), FakeTarget()
+    cfg = _config(target_names=["t1", "t2"])
+    report = Validator(cfg, source, {"t1": t1, "t2": t2}).run(fail_fast=True)
+    assert report.passed is True
+    assert len(t2.received) == 1
+
+
 def test_validator_unknown_target():
     source = FakeSource()
     v = Validator(_config(), source, {"t1": FakeTarget()})
@@ -187,3 +282,36 @@ def test_validator_exception_captured():
     report = v.run()
     assert report.passed is False
     assert any("boom" in r.message for r in report.results)
+
+
+def test_validator_loads_source_once():
+    class CountingSource(FakeSource):
+        calls = 0
+
+        def load_servers(self) -> dict[str, ServerConfig]:
+            CountingSource.calls += 1
+            return super().load_servers()
+
+    source = CountingSource(servers={"a": _sc("a")})
+    t1, t2 = FakeTarget(), FakeTarget()
+    v = Validator(_config(target_names=["t1", "t2"]), source, {"t1": t1, "t2": t2})
+    v.run()
+    assert CountingSource.calls == 1
+    assert t1.received == [{"a": _sc("a")}]
+    assert t2.received == t1.received
+
+
+def test_validator_source_error():
+    class BrokenSource(FakeSource):
+        def load_servers(self) -> dict[str, ServerConfig]:
+            raise RuntimeError("source boom")
+
+    rules_ok = ValidationResult(name="t1 rules", passed=True, message="ok")
+    t1 = FakeTarget(validation_results=[rules_ok])
+    v = Validator(_config(), BrokenSource(), {"t1": t1})
+    report = v.run()
+    assert report.passed is False
+    assert report.results[0].name == "source servers"
+    assert "source boom" in report.results[0].message
+    assert t1.received == [None]
+    assert rules_ok in report.results